@@ -119,8 +119,9 @@ Examples:
         print("SUMMARY")
         print(f"{'='*60}")
         print(f"Total games: {len(predictions)}")
-        print(f"Successfully predicted: {sum(1 for p in predictions if not p.get('error'))}")
-        print(f"Errors: {sum(1 for p in predictions if p.get('error'))}")
+        error_count = sum(1 for p in predictions if p.get('error'))
+        print(f"Successfully predicted: {len(predictions) - error_count}")
+        print(f"Errors: {error_count}")
 
         if args.save_to_db:
             print(f"Database records: {saved_count}")
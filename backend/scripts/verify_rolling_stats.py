@@ -37,17 +37,21 @@ def verify_previous_season_usage():
         print(f"{'Week':<6} {'Teams':<8} {'Using Prev':<12} {'Avg Prev':<10} {'Avg Current'}")
         print("-" * 50)
         
-        for week in range(1, 6):
-            stats = session.execute(text("""
-                SELECT 
-                    COUNT(*) as total,
-                    SUM(CASE WHEN prev_season_games_in_3wk > 0 THEN 1 ELSE 0 END) as using_prev,
-                    AVG(prev_season_games_in_3wk) as avg_prev,
-                    AVG(games_in_season) as avg_current
-                FROM team_rolling_stats
-                WHERE year = 2022 AND week = :week
-            """), {'week': week}).fetchone()
-            
+        # One grouped query for all five weeks instead of one query per week
+        weekly_stats = session.execute(text("""
+            SELECT 
+                week,
+                COUNT(*) as total,
+                SUM(CASE WHEN prev_season_games_in_3wk > 0 THEN 1 ELSE 0 END) as using_prev,
+                AVG(prev_season_games_in_3wk) as avg_prev,
+                AVG(games_in_season) as avg_current
+            FROM team_rolling_stats
+            WHERE year = 2022 AND week BETWEEN 1 AND 5
+            GROUP BY week
+            ORDER BY week
+        """)).fetchall()
+        
+        for week, *stats in weekly_stats:
             pct = stats[1]/stats[0]*100 if stats[0] > 0 else 0
             print(f"{week:<6} {stats[0]:<8} {stats[1]:<4} ({pct:>4.1f}%) {stats[2]:>8.2f} {stats[3]:>10.2f}")
 
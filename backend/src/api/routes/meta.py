@@ -50,7 +50,7 @@ def get_meta(db: Session = Depends(get_db)):
     
     seasons_result = db.execute(seasons_query).fetchall()
 
-    # Group weeks by year
+    # Group weeks by year; rows arrive newest year first, which dicts keep
     seasons_dict = {}
     for row in seasons_result:
         if row.year not in seasons_dict:
@@ -59,7 +59,7 @@ def get_meta(db: Session = Depends(get_db)):
 
     seasons = [
         SeasonMeta(year=year, weeks_with_predictions=weeks)
-        for year, weeks in sorted(seasons_dict.items(), reverse=True)
+        for year, weeks in seasons_dict.items()
     ]
 
     return MetaResponse(
@@ -2,6 +2,7 @@
 predictions.py - routes data for prediction data 
 Here we will query the databse and return prediction data matching the API contract
 """
+from collections import Counter
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import text
@@ -195,14 +196,15 @@ def get_week_predictions(
 
     games_count = len(predictions)
 
-    #count correct predictions only for completed games
-    completed_predictions = [p for p in predictions if p.was_correct is not None]
-    correct_count = sum(1 for p in completed_predictions if p.was_correct)
+    #count correct predictions only for completed games (was_correct is None until played)
+    outcomes = Counter(p.was_correct for p in predictions)
+    correct_count = outcomes[True]
+    completed_count = correct_count + outcomes[False]
 
     #check accuracy 
     accuracy = None
-    if completed_predictions:
-        accuracy = round(correct_count / len(completed_predictions), 4)
+    if completed_count:
+        accuracy = round(correct_count / completed_count, 4)
 
     #build response according to schema.py
     return WeekPredictionsResponse(
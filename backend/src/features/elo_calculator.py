@@ -12,17 +12,95 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
+import math
+from collections import defaultdict
 import numpy as np
 import pandas as pd
 from typing import Dict, Tuple, Optional
 from sqlalchemy import text
 import logging
 
+try:
+    import numba
+except ImportError:  # numba is optional; the ELO loop falls back to plain Python
+    numba = None
+
 from src.database.connection import DatabaseConnection
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Columns of the calculate_historical_elos() result
+ELO_RESULT_COLUMNS = [
+    'game_id', 'year', 'week', 'home_team_id', 'away_team_id',
+    'home_elo_before', 'away_elo_before', 'home_elo_after', 'away_elo_after',
+    'home_elo_change', 'away_elo_change'
+]
+
+# Columns written to the game_elos table
+GAME_ELO_COLUMNS = [
+    'game_id', 'home_team_id', 'away_team_id',
+    'home_elo_before', 'away_elo_before', 'home_elo_after', 'away_elo_after',
+    'home_elo_change', 'away_elo_change'
+]
+
+# 10 ** (x / 400) == exp(x * ln(10) / 400); exp is cheaper than a generic pow
+_LN10_OVER_400 = math.log(10) / 400.0
+
+
+def _elo_pass(home_idx, away_idx, margin, home_won, new_season, elo,
+              home_before, away_before, home_change,
+              k_factor, home_advantage, season_regression, starting_elo):
+    """
+    Run the game-by-game ELO recurrence over index-mapped games.
+
+    Same maths as ELOCalculator.update_elo() and regress_elos_for_new_season(),
+    on plain sequences so the loop does no dict lookups. Works on lists or,
+    when numba compiles it, on NumPy arrays.
+
+    Args:
+        home_idx, away_idx: Team index of each game's home/away team
+        margin: Absolute point differential of each game
+        home_won: Whether the home team won each game
+        new_season: Whether each game is the first of a new season
+        elo: Current rating of every team index (updated in place)
+        home_before, away_before, home_change: Per-game outputs, filled in place
+    """
+    for i in range(len(home_idx)):
+        if new_season[i]:
+            for t in range(len(elo)):
+                elo[t] = season_regression * elo[t] + (1 - season_regression) * starting_elo
+
+        h = home_idx[i]
+        a = away_idx[i]
+        home_elo = elo[h]
+        away_elo = elo[a]
+        home_before[i] = home_elo
+        away_before[i] = away_elo
+
+        # +1 if the home team won, -1 if the away team did: flips the game
+        # to the winner's point of view without branching on the result
+        sign = 2.0 * home_won[i] - 1.0
+        gap = sign * (home_elo - away_elo)  # winner_elo - loser_elo
+
+        expected_winner = 1 / (1 + math.exp(-(gap + sign * home_advantage) * _LN10_OVER_400))
+
+        multiplier = math.log(margin[i] + 1) * 2.2
+        if gap < 0:  # Upset
+            multiplier *= 1.2
+        multiplier = min(multiplier, 3.0)
+
+        winner_change = k_factor * multiplier * (1.0 - expected_winner)
+        change = sign * winner_change
+        elo[h] = home_elo + change
+        elo[a] = away_elo - change
+        home_change[i] = change
+
+
+if numba is not None:
+    # Compiled once and cached on disk; nogil lets other threads run meanwhile
+    _elo_pass = numba.njit(cache=True, nogil=True)(_elo_pass)
+
 
 class ELOCalculator:
     """
@@ -38,7 +116,11 @@ class ELOCalculator:
     def __init__(self, db_connection: Optional[DatabaseConnection] = None):
         """Initialize ELO calculator with database connection."""
         self.db = db_connection or DatabaseConnection()
-        self.team_elos: Dict[int, float] = {}  # team_id -> current ELO
+        self.team_elos: Dict[int, float] = self._elo_table()  # team_id -> current ELO
+
+    def _elo_table(self, items=()) -> Dict[int, float]:
+        """team_id -> ELO mapping where unseen teams start at STARTING_ELO."""
+        return defaultdict(lambda: float(self.STARTING_ELO), items)
 
     def expected_score(self, elo_a: float, elo_b: float, home_advantage: float = 0) -> float:
         """
@@ -52,7 +134,7 @@ class ELOCalculator:
         Returns:
             Expected probability that team A wins (0.0 to 1.0)
         """
-        return 1 / (1 + 10 ** ((elo_b - (elo_a + home_advantage)) / 400))
+        return 1 / (1 + math.exp((elo_b - (elo_a + home_advantage)) * _LN10_OVER_400))
 
     def margin_multiplier(self, margin: int, winner_elo: float, loser_elo: float) -> float:
         """
@@ -91,9 +173,9 @@ class ELOCalculator:
         Returns:
             Tuple of (new_winner_elo, new_loser_elo, winner_change, loser_change)
         """
-        # Get current ELOs (default to starting ELO if not found)
-        winner_elo = self.team_elos.get(winner_id, self.STARTING_ELO)
-        loser_elo = self.team_elos.get(loser_id, self.STARTING_ELO)
+        # Get current ELOs (unseen teams start at the starting ELO)
+        winner_elo = self.team_elos[winner_id]
+        loser_elo = self.team_elos[loser_id]
 
         # Determine home advantage
         home_adv = self.HOME_ADVANTAGE if is_home_win else -self.HOME_ADVANTAGE
@@ -126,11 +208,11 @@ class ELOCalculator:
         Regress all ELO ratings toward mean for new season.
         Accounts for roster turnover and program changes.
         """
-        for team_id in self.team_elos:
-            current_elo = self.team_elos[team_id]
-            regressed_elo = (self.SEASON_REGRESSION * current_elo +
-                           (1 - self.SEASON_REGRESSION) * self.STARTING_ELO)
-            self.team_elos[team_id] = regressed_elo
+        count = len(self.team_elos)
+        elos = np.fromiter(self.team_elos.values(), dtype=float, count=count)
+        regressed = (self.SEASON_REGRESSION * elos +
+                     (1 - self.SEASON_REGRESSION) * self.STARTING_ELO)
+        self.team_elos = self._elo_table(zip(self.team_elos.keys(), regressed.tolist()))
 
         logger.info(f"Regressed {len(self.team_elos)} team ELOs for new season")
 
@@ -164,65 +246,65 @@ class ELOCalculator:
 
         logger.info(f"Processing {len(games)} games...")
 
-        results = []
-        current_year = start_year
-
-        for game in games:
-            game_id, year, week, home_id, away_id, home_score, away_score, game_date = game
-
-            # Check if new season - regress ELOs
-            if year > current_year:
-                logger.info(f"Season transition: {current_year} → {year}")
-                self.regress_elos_for_new_season()
-                current_year = year
-
-            # Get ELOs before game
-            home_elo_before = self.team_elos.get(home_id, self.STARTING_ELO)
-            away_elo_before = self.team_elos.get(away_id, self.STARTING_ELO)
-
-            # Determine winner and margin
-            if home_score > away_score:
-                winner_id = home_id
-                loser_id = away_id
-                margin = home_score - away_score
-                is_home_win = True
-            else:
-                winner_id = away_id
-                loser_id = home_id
-                margin = away_score - home_score
-                is_home_win = False
-
-            # Update ELOs
-            new_winner_elo, new_loser_elo, winner_change, loser_change = \
-                self.update_elo(winner_id, loser_id, margin, is_home_win)
-
-            # Store results
-            if is_home_win:
-                home_elo_after = new_winner_elo
-                away_elo_after = new_loser_elo
-                home_elo_change = winner_change
-                away_elo_change = loser_change
-            else:
-                home_elo_after = new_loser_elo
-                away_elo_after = new_winner_elo
-                home_elo_change = loser_change
-                away_elo_change = winner_change
-
-            results.append({
-                'game_id': game_id,
-                'year': year,
-                'week': week,
-                'home_team_id': home_id,
-                'away_team_id': away_id,
-                'home_elo_before': home_elo_before,
-                'away_elo_before': away_elo_before,
-                'home_elo_after': home_elo_after,
-                'away_elo_after': away_elo_after,
-                'home_elo_change': home_elo_change,
-                'away_elo_change': away_elo_change
-            })
-
-        df = pd.DataFrame(results)
+        n = len(games)
+        if n == 0:
+            return pd.DataFrame(columns=ELO_RESULT_COLUMNS)
+
+        game_ids, years, weeks, home_ids, away_ids, home_scores, away_scores, _ = zip(*games)
+        years = np.array(years, dtype=np.int64)
+        home_scores = np.array(home_scores, dtype=np.int64)
+        away_scores = np.array(away_scores, dtype=np.int64)
+
+        # Map team ids (plus any teams already rated) to dense indices once
+        known_ids = np.fromiter(self.team_elos.keys(), dtype=np.int64, count=len(self.team_elos))
+        team_ids, team_idx = np.unique(
+            np.concatenate([np.array(home_ids, dtype=np.int64),
+                            np.array(away_ids, dtype=np.int64), known_ids]),
+            return_inverse=True
+        )
+        home_idx = team_idx[:n]
+        away_idx = team_idx[n:2 * n]
+
+        elo = np.full(len(team_ids), float(self.STARTING_ELO))
+        elo[team_idx[2 * n:]] = list(self.team_elos.values())
+
+        # Everything that doesn't depend on the running ratings, computed for all games at once
+        home_won = home_scores > away_scores
+        margin = np.abs(home_scores - away_scores)
+        new_season = np.diff(years, prepend=start_year) > 0
+        transitions = np.flatnonzero(new_season)
+        from_years = np.where(transitions > 0, years[transitions - 1], start_year)
+        for from_year, year in zip(from_years, years[transitions]):
+            logger.info(f"Season transition: {from_year} → {year}")
+
+        # Only the rating recurrence itself is sequential. Compiled, it wants
+        # arrays; interpreted, plain lists index much faster than arrays
+        if numba is not None:
+            inputs = (home_idx, away_idx, margin, home_won, new_season, elo)
+            outputs = (np.empty(n), np.empty(n), np.empty(n))
+        else:
+            inputs = (home_idx.tolist(), away_idx.tolist(), margin.tolist(),
+                      home_won.tolist(), new_season.tolist(), elo.tolist())
+            outputs = ([0.0] * n, [0.0] * n, [0.0] * n)
+        _elo_pass(*inputs, *outputs,
+                  self.K_FACTOR, self.HOME_ADVANTAGE, self.SEASON_REGRESSION, self.STARTING_ELO)
+
+        self.team_elos = self._elo_table(zip(team_ids.tolist(), np.asarray(inputs[-1]).tolist()))
+        home_before, away_before, home_change = (np.asarray(col) for col in outputs)
+
+        df = pd.DataFrame({
+            'game_id': game_ids,
+            'year': years,
+            'week': weeks,
+            'home_team_id': home_ids,
+            'away_team_id': away_ids,
+            'home_elo_before': home_before,
+            'away_elo_before': away_before,
+            'home_elo_after': home_before + home_change,
+            'away_elo_after': away_before - home_change,
+            'home_elo_change': home_change,
+            'away_elo_change': -home_change
+        })
         logger.info(f"Calculated ELOs for {len(df)} games")
 
         return df
@@ -252,8 +334,10 @@ class ELOCalculator:
             # Clear existing data
             session.execute(text("DELETE FROM game_elos"))
 
-            # Insert new data
-            for _, row in elo_df.iterrows():
+            # Insert new data - one executemany for the whole frame rather than
+            # a round trip per row
+            records = elo_df[GAME_ELO_COLUMNS].to_dict('records') if len(elo_df) else []
+            if records:
                 session.execute(text("""
                     INSERT INTO game_elos
                     (game_id, home_team_id, away_team_id,
@@ -265,21 +349,34 @@ class ELOCalculator:
                      :home_elo_before, :away_elo_before,
                      :home_elo_after, :away_elo_after,
                      :home_elo_change, :away_elo_change)
-                """), row.to_dict())
+                """), records)
 
             session.commit()
             logger.info(f"Saved {len(elo_df)} ELO records to database")
 
     def get_team_current_elo(self, team_id: int) -> float:
         """Get current ELO for a team."""
-        return self.team_elos.get(team_id, self.STARTING_ELO)
+        # .get() so a lookup doesn't add the team to the table
+        return self.team_elos.get(team_id, float(self.STARTING_ELO))
 
     def get_top_teams(self, n: int = 25) -> pd.DataFrame:
         """Get top N teams by current ELO."""
-        rankings = [(team_id, elo) for team_id, elo in self.team_elos.items()]
-        rankings.sort(key=lambda x: x[1], reverse=True)
+        count = len(self.team_elos)
+        if n <= 0 or count == 0:
+            return pd.DataFrame(columns=['team_id', 'elo'])
+
+        team_ids = np.fromiter(self.team_elos.keys(), dtype=np.int64, count=count)
+        elos = np.fromiter(self.team_elos.values(), dtype=float, count=count)
+
+        # Partial selection - no need to sort every team to show the top N
+        if n < count:
+            top = np.argpartition(-elos, n - 1)[:n]
+        else:
+            top = np.arange(count)
+        # Highest ELO first; ties keep insertion order
+        top = top[np.lexsort((top, -elos[top]))]
 
-        return pd.DataFrame(rankings[:n], columns=['team_id', 'elo'])
+        return pd.DataFrame({'team_id': team_ids[top], 'elo': elos[top]})
 
 
 def main():
@@ -307,10 +404,14 @@ def main():
     from src.database.teams_model import Team
     db = DatabaseConnection()
     with db.get_session() as session:
-        for idx, (team_id, elo) in top_teams.iterrows():
-            team = session.query(Team).filter(Team.id == team_id).first()
-            team_name = team.name if team else f"Team {team_id}"
-            print(f"  {idx+1:2d}. {team_name:30s} ELO: {elo:.0f}")
+        # One query for every name instead of one per ranked team
+        top_ids = top_teams['team_id'].tolist()
+        id_to_name = dict(
+            session.query(Team.id, Team.name).filter(Team.id.in_(top_ids)).all()
+        )
+        for rank, (team_id, elo) in enumerate(zip(top_ids, top_teams['elo'].tolist()), start=1):
+            team_name = id_to_name.get(team_id, f"Team {team_id}")
+            print(f"  {rank:2d}. {team_name:30s} ELO: {elo:.0f}")
 
     # Save to database
     print(f"\n💾 Saving ELO data to database...")
@@ -1,12 +1,88 @@
 import logging
 import numpy as np
+from operator import attrgetter
+from dataclasses import dataclass, field as dataclass_field
 from typing import Dict, List, Optional, Tuple
-from datetime import datetime
+from datetime import date, datetime
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# Numeric team_game_stats fields that the window stats sum with decay weights
+WEIGHTED_SUM_FIELDS = (
+    'total_offense_yards', 'total_offense_plays',
+    'third_down_conversions', 'third_down_attempts',
+    'opp_total_offense_yards', 'opp_total_offense_plays',
+    'passing_yards', 'rushing_yards',
+)
+
+# Per-game columns built once per team: the weighted sums, the scores that
+# season totals reuse, the turnover counts, and the win flag as 0/1 for win
+# counts and streaks
+GAME_COLUMN_FIELDS = WEIGHTED_SUM_FIELDS + (
+    'points_scored', 'points_allowed', 'margin', 'win',
+    'fumbles_lost', 'passing_interceptions', 'opp_fumbles_lost',
+)
+# Column position of each GAME_COLUMN_FIELDS field in a _to_table() table
+GAME_COLUMN_INDEX = {field: i for i, field in enumerate(GAME_COLUMN_FIELDS)}
+
+# team_game_stats columns the calculations read; loading only these keeps
+# each cached game dict small instead of carrying every stats column
+TEAM_GAME_FIELDS = (
+    'game_id', 'opponent_id', 'points_scored', 'points_allowed', 'win',
+    'fumbles_lost', 'passing_interceptions', 'opp_fumbles_lost',
+) + WEIGHTED_SUM_FIELDS
+
+# Feature names written as NULL when a team has too few games
+WINDOW_STAT_FIELDS = (
+    'ppg', 'papg', 'ypp', 'opp_ypp', 'margin',
+    'third_down_pct', 'turnover_diff', 'total_yards',
+    'opp_total_yards', 'pass_ratio', 'sos',
+)
+SEASON_STAT_FIELDS = ('ppg', 'papg', 'ypp', 'margin', 'total_yards', 'sos')
+TREND_FIELDS = ('ppg_trend', 'margin_trend', 'defensive_trend', 'win_streak')
+
+
+@dataclass(slots=True)
+class TeamGame:
+    """
+    One team's game as loaded by RollingStatsCalculator._get_team_games().
+    
+    A batch run caches every game of every team season, so these are
+    slotted rather than dicts.
+    """
+    # TEAM_GAME_FIELDS
+    game_id: int
+    opponent_id: int
+    points_scored: Optional[int]
+    points_allowed: Optional[int]
+    win: Optional[bool]
+    fumbles_lost: Optional[int]
+    passing_interceptions: Optional[int]
+    opp_fumbles_lost: Optional[int]
+    total_offense_yards: Optional[int]
+    total_offense_plays: Optional[int]
+    third_down_conversions: Optional[int]
+    third_down_attempts: Optional[int]
+    opp_total_offense_yards: Optional[int]
+    opp_total_offense_plays: Optional[int]
+    passing_yards: Optional[int]
+    rushing_yards: Optional[int]
+    # From games
+    week: int
+    year: int
+    game_date: Optional[date]
+    # points_scored - points_allowed; window, season and trend stats all reuse it
+    margin: Optional[int] = dataclass_field(init=False)
+
+    def __post_init__(self):
+        if self.points_scored is None or self.points_allowed is None:
+            self.margin = None
+        else:
+            self.margin = self.points_scored - self.points_allowed
+
+
 class RollingStatsCalculator:
     """
     Calculates rolling statistics for team performance.
@@ -32,18 +108,41 @@ class RollingStatsCalculator:
         self.windows = [3, 5]  # Calculate 3 and 5 week windows
         self.min_games = 2  # Minimum games needed for any calculation
         
+        # Whole team seasons, newest game first: (team_id, year) -> games; reset on every batch run
+        self._season_games_cache = {}
+        # The same seasons as GAME_COLUMN_FIELDS tables (one row per game, same order); reset on every batch run
+        self._season_table_cache = {}
+        # Running totals of those tables from the oldest game back (row i sums rows i..end); reset on every batch run
+        self._season_totals_cache = {}
+        # game_elos rows: game_id -> row (None if the game has no ELO); reset on every batch run
+        self._game_elo_cache = {}
+        # Compiled upsert statements keyed by the tuple of columns being written
+        self._upsert_cache = {}
+        
         logger.info(f"Initialized calculator with prev_season_weight={prev_season_weight}")
 
-    def calculate_for_all_games(self, start_year: int = 2022, end_year: int = 2023):
+    def calculate_for_all_games(self, start_year: int = 2022, end_year: int = 2023,
+                                start_week: int = 1):
         """
         Calculate rolling stats for all games in the specified years.
         This is the main entry point for batch processing..
         
+        Rolling stats for a game only depend on the weeks before it, so after
+        importing new weeks only games from the earliest new week onwards
+        need recalculating; pass that week as start_week.
+        
         Args:
             start_year: First year to calculate
             end_year: Last year to calculate
+            start_week: First week of start_year to calculate (later years are always done in full)
         """
-        logger.info(f"Calculating rolling stats for {start_year}-{end_year}")
+        logger.info(f"Calculating rolling stats for {start_year}-{end_year} from week {start_week}")
+        
+        # Games may have been imported since the last run
+        self._season_games_cache.clear()
+        self._season_table_cache.clear()
+        self._season_totals_cache.clear()
+        self._game_elo_cache.clear()
         
         with self.db.get_session() as session:
             # Get all games in date range
@@ -51,27 +150,30 @@ class RollingStatsCalculator:
                 SELECT id, year, week, home_team_id, away_team_id
                 FROM games
                 WHERE year BETWEEN :start_year AND :end_year
+                  AND (year > :start_year OR week >= :start_week)
                 ORDER BY year, week, id
-            """), {'start_year': start_year, 'end_year': end_year}).fetchall()
+            """), {'start_year': start_year, 'end_year': end_year, 'start_week': start_week}).fetchall()
             
             total_games = len(games)
             logger.info(f"Found {total_games} games to process")
             
+            # Bound once rather than looked up twice per game
+            calculate_team_stats = self._calculate_team_stats
+            save_stats = self._save_stats
+            
             processed = 0
-            for game in games:
-                game_id, year, week, home_id, away_id = game
-                
+            for game_id, year, week, home_id, away_id in games:
                 # Calculate for home team
-                home_stats = self._calculate_team_stats(
+                home_stats = calculate_team_stats(
                     session, game_id, home_id, away_id, year, week
                 )
-                self._save_stats(session, home_stats)
+                save_stats(session, home_stats)
                 
                 # Calculate for away team
-                away_stats = self._calculate_team_stats(
+                away_stats = calculate_team_stats(
                     session, game_id, away_id, home_id, year, week
                 )
-                self._save_stats(session, away_stats)
+                save_stats(session, away_stats)
                 
                 processed += 1
                 if processed % 100 == 0:
@@ -108,23 +210,22 @@ class RollingStatsCalculator:
         prev_season_games_needed = max(0, 3 - (week - 1))
         
         # Get current season games before this week
-        current_games = self._get_team_games(
+        current_games = self._get_current_season_games(
             session, team_id, year, max_week=week-1
         )
         
         # Get previous season games if needed (for early weeks)
         previous_games = []
         if prev_season_games_needed > 0 and year > 2021:
-            previous_games = self._get_team_games(
-                session, team_id, year-1, max_week = None,
-                last_n=prev_season_games_needed
+            previous_games = self._get_previous_season_games(
+                session, team_id, year-1, prev_season_games_needed
             )
         
         # Combine games for calculations
         all_games = current_games + previous_games
         
         if len(all_games) < self.min_games:
-            logger.debug(f"Team {team_id} has only {len(all_games)} games before week {week}")
+            logger.debug("Team %s has only %d games before week %s", team_id, len(all_games), week)
             return self._create_null_stats(stats)
         
         # Track data quality
@@ -132,23 +233,37 @@ class RollingStatsCalculator:
         stats['prev_season_games_in_3wk'] = min(len(previous_games), 3)
         stats['prev_season_games_in_5wk'] = min(len(previous_games), 5)
         
+        # Table of every game, sliced from the cached season tables. The current
+        # games are the oldest of their (newest-first) season and the
+        # previous-season games the newest of theirs; each window takes a prefix
+        season_table = self._get_season_table(session, team_id, year)
+        first = len(season_table) - len(current_games)
+        table = season_table[first:]
+        if previous_games:
+            prev_table = self._get_season_table(session, team_id, year-1)
+            table = np.concatenate((table, prev_table[:len(previous_games)]))
+        
         # Calculate for each window
         for window in self.windows:
             window_stats = self._calculate_window_stats(
                 all_games[:window], 
                 window,
-                prev_season_count=len(previous_games)
+                prev_season_count=len(previous_games),
+                table=table
             )
             stats.update(window_stats)
         
         # Calculate season stats (current season only)
         if current_games:
-            season_stats = self._calculate_season_stats(current_games)
+            # The current games are the oldest rows of the season table, so their
+            # totals are one row of the running totals
+            season_totals = self._get_season_totals(session, team_id, year)[first]
+            season_stats = self._calculate_season_stats(current_games, totals=season_totals)
             stats.update(season_stats)
         
         # Calculate momentum indicators
         if len(all_games) >= 6:
-            trend_stats = self._calculate_trends(all_games)
+            trend_stats = self._calculate_trends(all_games, table=table)
             stats.update(trend_stats)
         
         # Calculate strength of schedule
@@ -162,24 +277,13 @@ class RollingStatsCalculator:
         return stats
 
 
-    def _get_team_games(
-        self, 
-        session: Session, 
-        team_id: int, 
-        year: int, 
-        max_week: Optional[int] = None,
-        last_n: Optional[int] = None
-    ) -> List[Dict]:
+    def _get_team_games(self, session: Session, team_id: int, year: int) -> List[TeamGame]:
         """
-        Fetch team games with all statistics.
-        
-        Args:
-            max_week: Only get games before this week
-            last_n: Get last N games of the season
+        Fetch a team's games for one season with all statistics, newest first.
         """
-        base_query = """
+        query = text(f"""
             SELECT 
-                tgs.*,
+                {', '.join(f'tgs.{field}' for field in TEAM_GAME_FIELDS)},
                 g.week,
                 g.year,
                 g.game_date
@@ -187,61 +291,141 @@ class RollingStatsCalculator:
             JOIN games g ON tgs.game_id = g.id
             WHERE tgs.team_id = :team_id
                 AND g.year = :year
-        """
+            ORDER BY g.week DESC, g.game_date DESC
+        """)
         
-        if max_week:
-            base_query += " AND g.week <= :max_week"
+        result = session.execute(query, {'team_id': team_id, 'year': year})
         
-        base_query += " ORDER BY g.week DESC, g.game_date DESC"
-        
-        if last_n:
-            base_query += f" LIMIT {last_n}"
+        # The SELECT lists the columns in TeamGame field order, so rows map
+        # positionally without building a keyword dict per row
+        return [TeamGame(*row) for row in result]
+
+    def _get_season_games(self, session: Session, team_id: int, year: int) -> List[TeamGame]:
+        """
+        Fetch a team's whole season once per batch run, newest game first.
         
-        params = {'team_id': team_id, 'year': year}
-        if max_week:
-            params['max_week'] = max_week
+        Every game a team plays needs a slice of the same season, so it is
+        queried and sorted once and sliced for each request.
+        """
+        key = (team_id, year)
+        games = self._season_games_cache.get(key)
+        if games is None:
+            games = self._season_games_cache[key] = self._get_team_games(session, team_id, year)
+        return games
+
+    def _get_season_table(self, session: Session, team_id: int, year: int) -> np.ndarray:
+        """
+        _to_table() of a cached team season, built once per batch run.
         
-        result = session.execute(text(base_query), params)
+        Rows line up with _get_season_games(); callers slice it rather than
+        rebuilding arrays from the game objects for every game.
+        """
+        key = (team_id, year)
+        table = self._season_table_cache.get(key)
+        if table is None:
+            table = self._season_table_cache[key] = self._to_table(
+                self._get_season_games(session, team_id, year), GAME_COLUMN_FIELDS
+            )
+        return table
+
+    def _get_season_totals(self, session: Session, team_id: int, year: int) -> np.ndarray:
+        """
+        Running totals of _get_season_table() from the oldest game back.
         
-        games = []
-        for row in result:
-            games.append(dict(row._mapping))
+        Row i holds the column sums of table rows i..end, i.e. of every game
+        up to and including that one, so the season totals before any week
+        are a single row lookup rather than a fresh sum per game.
+        """
+        key = (team_id, year)
+        totals = self._season_totals_cache.get(key)
+        if totals is None:
+            table = self._get_season_table(session, team_id, year)
+            totals = self._season_totals_cache[key] = np.cumsum(table[::-1], axis=0)[::-1]
+        return totals
+
+    def _get_current_season_games(
+        self,
+        session: Session,
+        team_id: int,
+        year: int,
+        max_week: Optional[int]
+    ) -> List[TeamGame]:
+        """
+        Games up to and including max_week, newest first, sliced from the
+        cached season.
+        """
+        games = self._get_season_games(session, team_id, year)
+        if not max_week:
+            return list(games)
+        return [g for g in games if g.week <= max_week]
+
+    def _get_previous_season_games(
+        self,
+        session: Session,
+        team_id: int,
+        year: int,
+        last_n: int
+    ) -> List[TeamGame]:
+        """
+        Fetch the last N games of a previous season from the cached season.
         
-        return games
+        Args:
+            team_id: Team to fetch
+            year: The previous season
+            last_n: Number of games wanted
+        """
+        return self._get_season_games(session, team_id, year)[:last_n]
 
     def _calculate_window_stats(
         self, 
-        games: List[Dict], 
+        games: List[TeamGame], 
         window: int,
-        prev_season_count: int = 0
+        prev_season_count: int = 0,
+        table: Optional[np.ndarray] = None
     ) -> Dict:
         """
         Calculate statistics for a specific window with decay weights.
         
         The key innovation here is applying decay weights to previous
         season games while keeping current season at full weight.
+        
+        Args:
+            table: Optional GAME_COLUMN_FIELDS _to_table() of a game list that
+                `games` is a prefix of; built from `games` if omitted
         """
         if not games:
             return {}
         
-        # Calculate weights for each game
-        weights = []
-        for i, game in enumerate(games):
-            if i >= len(games) - prev_season_count:
-                # This is a previous season game
-                weights.append(self.prev_season_weight)
-            else:
-                # Current season game
-                weights.append(1.0)
-        
-        weights = np.array(weights)
+        # Calculate weights for each game: current season games at full
+        # weight, previous season games (always the oldest) decayed
+        n = len(games)
+        first_prev = max(n - prev_season_count, 0)
+        weights = np.ones(n)
+        single_season = first_prev == n
+        if not single_season:
+            weights[first_prev:] = self.prev_season_weight
         prefix = f"{window}wk"
         
+        if table is None:
+            table = self._to_table(games, GAME_COLUMN_FIELDS)
+        else:
+            table = table[:len(games)]
+        
         stats = {
             f'games_in_{prefix}': len(games)
         }
         
-        # Helper function for weighted average
+        # Every weighted sum the window needs, in one product over the table.
+        # Most windows lie within one season, where they are plain column sums
+        if single_season:
+            sums = table.sum(axis=0)
+            weight_total = float(n)
+        else:
+            sums = weights @ table
+            weight_total = weights.sum()
+        sums = dict(zip(GAME_COLUMN_FIELDS, sums.tolist()))
+        
+        # Helper function for weighted average of values that may be None
         def weighted_avg(values):
             values = np.array([v for v in values if v is not None])
             if len(values) == 0:
@@ -254,15 +438,12 @@ class RollingStatsCalculator:
             return np.average(values, weights=w)
         
         # Offensive metrics
-        stats[f'ppg_{prefix}'] = weighted_avg([g['points_scored'] for g in games])
-        stats[f'papg_{prefix}'] = weighted_avg([g['points_allowed'] for g in games])
+        stats[f'ppg_{prefix}'] = sums['points_scored'] / weight_total
+        stats[f'papg_{prefix}'] = sums['points_allowed'] / weight_total
         
         # Calculate yards per play
-        total_yards = sum((g['total_offense_yards'] or 0) * weights[i] 
-                         for i, g in enumerate(games))
-        total_plays = sum((g['total_offense_plays'] or 0) * weights[i] 
-                         for i, g in enumerate(games))
-        total_weight = sum(weights)
+        total_yards = sums['total_offense_yards']
+        total_plays = sums['total_offense_plays']
         
         if total_plays > 0:
             stats[f'ypp_{prefix}'] = total_yards / total_plays
@@ -270,52 +451,41 @@ class RollingStatsCalculator:
             stats[f'ypp_{prefix}'] = None
         
         # Total yards per game
-        stats[f'total_yards_{prefix}'] = weighted_avg([g['total_offense_yards'] for g in games])
+        stats[f'total_yards_{prefix}'] = weighted_avg([g.total_offense_yards for g in games])
         
         # Third down percentage
-        third_conv = sum((g['third_down_conversions'] or 0) * weights[i] 
-                        for i, g in enumerate(games))
-        third_att = sum((g['third_down_attempts'] or 0) * weights[i] 
-                       for i, g in enumerate(games))
+        third_conv = sums['third_down_conversions']
+        third_att = sums['third_down_attempts']
         
         if third_att > 0:
             stats[f'third_down_pct_{prefix}'] = (third_conv / third_att) * 100
         else:
             stats[f'third_down_pct_{prefix}'] = None
         
-        # Turnover differential per game
-        turnovers_lost = [(g.get('fumbles_lost', 0) or 0) + 
-                         (g.get('passing_interceptions', 0) or 0) 
-                         for g in games]
-        turnovers_gained = [(g.get('opp_fumbles_lost', 0) or 0) + 
-                           (g.get('defense_interceptions', 0) or 0) 
-                           for g in games]
-        
-        to_diff = [gained - lost for gained, lost in zip(turnovers_gained, turnovers_lost)]
-        stats[f'turnover_diff_{prefix}'] = weighted_avg(to_diff)
+        # Turnover differential per game (NULL counts are 0 in the columns).
+        # team_game_stats has no defense_interceptions column, so takeaways are
+        # the opponent's lost fumbles only
+        turnovers_lost = sums['fumbles_lost'] + sums['passing_interceptions']
+        turnovers_gained = sums['opp_fumbles_lost']
+        stats[f'turnover_diff_{prefix}'] = (turnovers_gained - turnovers_lost) / weight_total
         
         # Defensive metrics
-        opp_yards = sum((g.get('opp_total_offense_yards', 0) or 0) * weights[i] 
-                       for i, g in enumerate(games))
-        opp_plays = sum((g.get('opp_total_offense_plays', 0) or 0) * weights[i] 
-                       for i, g in enumerate(games))
+        opp_yards = sums['opp_total_offense_yards']
+        opp_plays = sums['opp_total_offense_plays']
         
         if opp_plays > 0:
             stats[f'opp_ypp_{prefix}'] = opp_yards / opp_plays
         else:
             stats[f'opp_ypp_{prefix}'] = None
         
-        stats[f'opp_total_yards_{prefix}'] = weighted_avg([g.get('opp_total_offense_yards') for g in games])
+        stats[f'opp_total_yards_{prefix}'] = weighted_avg([g.opp_total_offense_yards for g in games])
         
         # Margin
-        margins = [g['points_scored'] - g['points_allowed'] for g in games]
-        stats[f'margin_{prefix}'] = weighted_avg(margins)
+        stats[f'margin_{prefix}'] = sums['margin'] / weight_total
         
         # Pass/rush ratio
-        pass_yards = sum((g.get('passing_yards', 0) or 0) * weights[i] 
-                        for i, g in enumerate(games))
-        rush_yards = sum((g.get('rushing_yards', 0) or 0) * weights[i] 
-                        for i, g in enumerate(games))
+        pass_yards = sums['passing_yards']
+        rush_yards = sums['rushing_yards']
         total_off = pass_yards + rush_yards
         
         if total_off > 0:
@@ -324,79 +494,108 @@ class RollingStatsCalculator:
             stats[f'pass_ratio_{prefix}'] = 0.5  # Default to balanced
         
         # Win tracking
-        wins = sum(1 for g in games[:window] if g.get('win'))
-        stats[f'last_{window}_wins'] = wins
+        stats[f'last_{window}_wins'] = int(table[:, GAME_COLUMN_INDEX['win']].sum())
         
         # Consistency metrics (standard deviation)
         if window == 3:
-            ppg_values = [g['points_scored'] for g in games[:3]]
-            margin_values = [g['points_scored'] - g['points_allowed'] for g in games[:3]]
-            
-            if len(ppg_values) >= 2:
-                stats['ppg_std_3wk'] = np.std(ppg_values)
-                stats['margin_std_3wk'] = np.std(margin_values)
+            if len(games) >= 2:
+                stats['ppg_std_3wk'] = np.std(table[:3, GAME_COLUMN_INDEX['points_scored']])
+                stats['margin_std_3wk'] = np.std(table[:3, GAME_COLUMN_INDEX['margin']])
         
         return stats
 
-    def _calculate_season_stats(self, games: List[Dict]) -> Dict:
-        """Calculate season-long statistics (current season only)."""
+    @staticmethod
+    def _to_table(games: List[TeamGame], fields: Tuple[str, ...]) -> np.ndarray:
+        """
+        Convert a list of games into a float table, one row per game and one
+        column per field. Missing/None values become 0, matching how the
+        weighted sums treat them.
+        
+        Args:
+            games: Games as returned by _get_team_games()
+            fields: Field names to extract
+            
+        Returns:
+            np.ndarray of shape (len(games), len(fields))
+        """
+        # Pull each game's fields in one C-level call; None turns into NaN in the
+        # float conversion and is zeroed for the whole table at once
+        row_values = attrgetter(*fields)
+        table = np.array(
+            [row_values(g) for g in games],
+            dtype=float
+        ).reshape(len(games), len(fields))
+        table[np.isnan(table)] = 0
+        return table
+
+    def _calculate_season_stats(
+        self,
+        games: List[TeamGame],
+        totals: Optional[np.ndarray] = None
+    ) -> Dict:
+        """
+        Calculate season-long statistics (current season only).
+        
+        Args:
+            totals: Optional GAME_COLUMN_FIELDS column sums over `games`;
+                summed from `games` if omitted
+        """
         if not games:
             return {}
         
+        n = len(games)
+        if totals is None:
+            totals = self._to_table(games, GAME_COLUMN_FIELDS).sum(axis=0)
+        total = dict(zip(GAME_COLUMN_FIELDS, totals.tolist()))
+        
         # No decay weights for season stats - current season only
         stats = {}
         
-        stats['ppg_season'] = np.mean([g['points_scored'] for g in games])
-        stats['papg_season'] = np.mean([g['points_allowed'] for g in games])
-        stats['margin_season'] = np.mean([g['points_scored'] - g['points_allowed'] for g in games])
+        stats['ppg_season'] = total['points_scored'] / n
+        stats['papg_season'] = total['points_allowed'] / n
+        stats['margin_season'] = total['margin'] / n
         
         # Total yards
-        total_yards = sum(g.get('total_offense_yards', 0) or 0 for g in games)
-        total_plays = sum(g.get('total_offense_plays', 0) or 0 for g in games)
+        total_yards = total['total_offense_yards']
+        total_plays = total['total_offense_plays']
         
         if total_plays > 0:
             stats['ypp_season'] = total_yards / total_plays
         
-        stats['total_yards_season'] = np.mean([g.get('total_offense_yards', 0) for g in games])
+        stats['total_yards_season'] = total_yards / n
         
         return stats
 
-    def _calculate_trends(self, games: List[Dict]) -> Dict:
+    def _calculate_trends(self, games: List[TeamGame], table: Optional[np.ndarray] = None) -> Dict:
         """
         Calculate momentum indicators by comparing recent vs previous performance.
         Positive trends indicate improvement.
+        
+        Args:
+            table: Optional GAME_COLUMN_FIELDS _to_table() aligned with games;
+                built from `games` if omitted
         """
-        recent_3 = games[:3]
-        previous_3 = games[3:6]
+        if table is None:
+            table = self._to_table(games, GAME_COLUMN_FIELDS)
+        
+        # Last three games against the three before them, every column at once
+        change = table[:3].mean(axis=0) - table[3:6].mean(axis=0)
         
         # PPG trend
-        recent_ppg = np.mean([g['points_scored'] for g in recent_3])
-        prev_ppg = np.mean([g['points_scored'] for g in previous_3])
-        ppg_trend = recent_ppg - prev_ppg
+        ppg_trend = change[GAME_COLUMN_INDEX['points_scored']]
         
-        # Margin trend  
-        recent_margin = np.mean([g['points_scored'] - g['points_allowed'] for g in recent_3])
-        prev_margin = np.mean([g['points_scored'] - g['points_allowed'] for g in previous_3])
-        margin_trend = recent_margin - prev_margin
+        # Margin trend
+        margin_trend = change[GAME_COLUMN_INDEX['margin']]
         
         # Defensive trend (negative is better)
-        recent_def = np.mean([g['points_allowed'] for g in recent_3])
-        prev_def = np.mean([g['points_allowed'] for g in previous_3])
-        defensive_trend = recent_def - prev_def
-        
-        # Win streak
-        streak = 0
-        for game in games:
-            if game.get('win'):
-                if streak >= 0:
-                    streak += 1
-                else:
-                    break
-            else:
-                if streak <= 0:
-                    streak -= 1
-                else:
-                    break
+        defensive_trend = change[GAME_COLUMN_INDEX['points_allowed']]
+        
+        # Win streak: length of the run matching the latest result, negative for losses
+        wins = table[:, GAME_COLUMN_INDEX['win']]
+        latest = wins[0]
+        breaks = np.flatnonzero(wins != latest)
+        run = int(breaks[0]) if breaks.size else len(wins)
+        streak = run if latest else -run
         
         return {
             'ppg_trend': ppg_trend,
@@ -405,7 +604,7 @@ class RollingStatsCalculator:
             'win_streak': streak
         }
 
-    def _calculate_sos(self, session: Session, games: List[Dict], windows: List[int]) -> Dict:
+    def _calculate_sos(self, session: Session, games: List[TeamGame], windows: List[int]) -> Dict:
         """
         Calculate strength of schedule for each window.
         Uses opponent win percentage as proxy for strength.
@@ -420,7 +619,7 @@ class RollingStatsCalculator:
                 continue
             
             # Get opponent records
-            opponent_ids = [g['opponent_id'] for g in window_games]
+            opponent_ids = [g.opponent_id for g in window_games]
             
             # Simplified SOS - you could enhance this
             # For now, using 0.5 as placeholder
@@ -433,7 +632,7 @@ class RollingStatsCalculator:
         return sos_stats
 
     def _calculate_elo_features(self, session: Session, team_id: int,
-                                game_id: int, games: List[Dict],
+                                game_id: int, games: List[TeamGame],
                                 windows: List[int]) -> Dict:
         """
         Calculate ELO-based features for the team.
@@ -445,12 +644,12 @@ class RollingStatsCalculator:
         """
         elo_stats = {}
 
+        # One lookup covers this game and the widest window; narrower windows reuse it
+        window_ids = [g.game_id for g in games[:max(windows, default=0)]]
+        elo_rows = self._get_game_elos(session, [game_id] + window_ids)
+
         # Get team's ELO before this game from game_elos table
-        result = session.execute(text("""
-            SELECT home_elo_before, away_elo_before, home_team_id
-            FROM game_elos
-            WHERE game_id = :game_id
-        """), {'game_id': game_id}).fetchone()
+        result = elo_rows.get(game_id)
 
         if not result:
             # No ELO data available - return nulls
@@ -461,24 +660,64 @@ class RollingStatsCalculator:
             return elo_stats
 
         # Determine which ELO is ours
-        home_elo, away_elo, home_team_id = result
+        _, home_team_id, _, home_elo, away_elo, _, _ = result
         current_elo = home_elo if team_id == home_team_id else away_elo
         elo_stats['current_elo'] = current_elo
 
-        # Get ELO history for windows
+        # One pass over the widest window keeping running totals; each window then
+        # reads the totals as of its last game instead of re-walking its games
+        rated = 0
+        change_sum = 0.0
+        opp_elo_sum = 0.0
+        totals = {0: (0, 0.0, 0.0)}  # games seen -> (rated games, change sum, opp ELO sum)
+        for seen, game in enumerate(games[:max(windows, default=0)], start=1):
+            row = elo_rows.get(game.game_id)
+            if row:
+                _, h_id, _, h_elo_before, a_elo_before, h_change, a_change = row
+                if team_id == h_id:
+                    change_sum += h_change
+                    opp_elo_sum += a_elo_before
+                else:
+                    change_sum += a_change
+                    opp_elo_sum += h_elo_before
+                rated += 1
+            totals[seen] = (rated, change_sum, opp_elo_sum)
+
         for window in windows:
-            window_games = games[:window] if len(games) >= window else games
+            rated, change_sum, opp_elo_sum = totals[min(window, len(games))]
 
-            if not window_games:
+            if not rated:
                 elo_stats[f'elo_change_{window}wk'] = None
                 elo_stats[f'avg_opp_elo_{window}wk'] = None
                 continue
 
-            # Get game IDs for this window
-            game_ids = [g['game_id'] for g in window_games]
+            # ELO change = sum of all changes in window
+            elo_stats[f'elo_change_{window}wk'] = change_sum
+
+            # Average opponent ELO
+            elo_stats[f'avg_opp_elo_{window}wk'] = opp_elo_sum / rated
+
+        return elo_stats
 
-            # Get ELO data for these games
-            elo_results = session.execute(text("""
+    def _get_game_elos(self, session: Session, game_ids: List[int]) -> Dict[int, Optional[tuple]]:
+        """
+        Fetch game_elos rows, memoized per batch run.
+        
+        Each game shows up in the windows of both teams' next several games,
+        so most rows are already cached; only unseen ids hit the database.
+        
+        Args:
+            game_ids: Games to look up
+            
+        Returns:
+            Dict mapping game_id -> (game_id, home_team_id, away_team_id,
+            home_elo_before, away_elo_before, home_elo_change, away_elo_change),
+            or None if the game has no ELO yet
+        """
+        cache = self._game_elo_cache
+        missing = [gid for gid in game_ids if gid not in cache]
+        if missing:
+            rows = session.execute(text("""
                 SELECT
                     ge.game_id,
                     ge.home_team_id,
@@ -489,55 +728,33 @@ class RollingStatsCalculator:
                     ge.away_elo_change
                 FROM game_elos ge
                 WHERE ge.game_id = ANY(:game_ids)
-                ORDER BY ge.game_id DESC
-            """), {'game_ids': game_ids}).fetchall()
-
-            if not elo_results:
-                elo_stats[f'elo_change_{window}wk'] = None
-                elo_stats[f'avg_opp_elo_{window}wk'] = None
-                continue
-
-            # Calculate ELO change (current - oldest in window)
-            elo_changes = []
-            opp_elos = []
-
-            for elo_row in elo_results:
-                gid, h_id, a_id, h_elo_before, a_elo_before, h_change, a_change = elo_row
-
-                if team_id == h_id:
-                    elo_changes.append(h_change)
-                    opp_elos.append(a_elo_before)
-                else:
-                    elo_changes.append(a_change)
-                    opp_elos.append(h_elo_before)
-
-            # ELO change = sum of all changes in window
-            elo_stats[f'elo_change_{window}wk'] = sum(elo_changes) if elo_changes else None
-
-            # Average opponent ELO
-            elo_stats[f'avg_opp_elo_{window}wk'] = np.mean(opp_elos) if opp_elos else None
-
-        return elo_stats
+            """), {'game_ids': missing}).fetchall()
+            for gid in missing:
+                cache[gid] = None
+            for row in rows:
+                cache[row[0]] = tuple(row)
+        return {gid: cache[gid] for gid in game_ids}
 
     def _create_null_stats(self, base_stats: Dict) -> Dict:
-        """Create a stats dict with NULL values when insufficient data."""
-        stats = base_stats.copy()
+        """Create a stats dict with NULL values when insufficient data.
+        
+        Fills in base_stats in place and returns it.
+        """
+        stats = base_stats
         
         # Add all fields as None
         for window in self.windows:
             prefix = f"{window}wk"
-            for field in ['ppg', 'papg', 'ypp', 'opp_ypp', 'margin', 
-                         'third_down_pct', 'turnover_diff', 'total_yards',
-                         'opp_total_yards', 'pass_ratio', 'sos']:
+            for field in WINDOW_STAT_FIELDS:
                 stats[f'{field}_{prefix}'] = None
             stats[f'games_in_{prefix}'] = 0
         
         # Season stats
-        for field in ['ppg', 'papg', 'ypp', 'margin', 'total_yards', 'sos']:
+        for field in SEASON_STAT_FIELDS:
             stats[f'{field}_season'] = None
         
         # Trends
-        for field in ['ppg_trend', 'margin_trend', 'defensive_trend', 'win_streak']:
+        for field in TREND_FIELDS:
             stats[field] = None
 
         # ELO features
@@ -557,48 +774,39 @@ class RollingStatsCalculator:
         if stats.get('games_in_season', 0) == 0:
             return  # Don't save records for teams with no games
         
-        # Convert numpy types
+        # One pass: drop NULL fields (left out of the upsert) and convert numpy types
         clean_stats = {}
         for key, value in stats.items():
+            if value is None:
+                continue
             if isinstance(value, np.number):
-                clean_stats[key] = float(value)
+                value = float(value)
             elif isinstance(value, np.ndarray):
-                clean_stats[key] = value.tolist()
-            else:
-                clean_stats[key] = value
+                value = value.tolist()
+            clean_stats[key] = value
         
         # Add timestamps
-        from datetime import datetime
-        clean_stats['created_at'] = datetime.utcnow()
-        clean_stats['updated_at'] = datetime.utcnow()
+        now = datetime.utcnow()
+        clean_stats['created_at'] = now
+        clean_stats['updated_at'] = now
         
         stats = clean_stats
         
-        # Build INSERT statement dynamically based on available fields
-        columns = []
-        values = []
-        
-        for key, value in stats.items():
-            if value is not None:
-                columns.append(key)
-                values.append(value)
-        
-        if not columns:
-            return
-        
-        # Create parameterized query
-        column_str = ', '.join(columns)
-        param_str = ', '.join([f':{col}' for col in columns])
-        
-        query = f"""
-            INSERT INTO team_rolling_stats ({column_str})
-            VALUES ({param_str})
-            ON CONFLICT (team_id, game_id) 
-            DO UPDATE SET {', '.join([f'{col} = :{col}' for col in columns if col not in ['team_id', 'game_id']])}
-        """
+        # Only a handful of NULL patterns occur, so each statement is built once
+        columns = tuple(stats)
+        query = self._upsert_cache.get(columns)
+        if query is None:
+            column_str = ', '.join(columns)
+            param_str = ', '.join([f':{col}' for col in columns])
+            query = self._upsert_cache[columns] = text(f"""
+                INSERT INTO team_rolling_stats ({column_str})
+                VALUES ({param_str})
+                ON CONFLICT (team_id, game_id) 
+                DO UPDATE SET {', '.join([f'{col} = :{col}' for col in columns if col not in ['team_id', 'game_id']])}
+            """)
         
         try:
-            session.execute(text(query), stats)
+            session.execute(query, stats)
         except Exception as e:
             logger.error(f"Failed to save stats: {e}")
-            logger.debug(f"Stats that failed: {stats}")
\ No newline at end of file
+            logger.debug("Stats that failed: %s", stats)
\ No newline at end of file
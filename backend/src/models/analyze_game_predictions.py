@@ -67,9 +67,10 @@ def analyze_game_predictions():
     y_pred = (y_prob > 0.5).astype(int)
     y_true = data['y_test']
     
-    # Get game details from the test set
+    # Get game details from the test set (take() already returns a new frame
+    # that is safe to add columns to, so no second copy is needed)
     test_indices = data['test_indices']
-    test_games = data['df'].iloc[test_indices].copy()
+    test_games = data['df'].take(test_indices)
     
     # Add predictions to dataframe
     test_games['predicted_prob'] = y_prob
@@ -104,7 +105,7 @@ def analyze_game_predictions():
         print(f"\nFound {len(high_conf)} high confidence games")
         print(f"Accuracy on these: {high_conf['correct'].mean():.1%}\n")
         
-        for idx, game in high_conf.head(10).iterrows():
+        for game in high_conf.head(10).to_dict('records'):
             result = "✅" if game['correct'] else "❌"
             print(f"{result} Week {game['week']}: {game['away_team']} @ {game['home_team']}")
             print(f"   Predicted: {game['predicted_winner']} ({game['confidence']:.1%} conf)")
@@ -127,7 +128,7 @@ def analyze_game_predictions():
     if len(big_misses) > 0:
         print(f"\nFound {len(big_misses)} high-confidence misses\n")
         
-        for idx, game in big_misses.head(5).iterrows():
+        for game in big_misses.head(5).to_dict('records'):
             print(f"❌ Week {game['week']}: {game['away_team']} @ {game['home_team']}")
             print(f"   Predicted: {game['predicted_winner']} ({game['confidence']:.1%} conf)")
             print(f"   Actual: {game['actual_winner']} (Score: {game['home_score']}-{game['away_score']})")
@@ -148,7 +149,7 @@ def analyze_game_predictions():
         print(f"\nPredicted {len(upsets)} upsets")
         print(f"Accuracy on upset picks: {upsets['correct'].mean():.1%}\n")
         
-        for idx, game in upsets.head(5).iterrows():
+        for game in upsets.head(5).to_dict('records'):
             result = "✅" if game['correct'] else "❌"
             print(f"{result} Week {game['week']}: {game['away_team']} @ {game['home_team']}")
             print(f"   Predicted: {game['predicted_winner']} ({game['confidence']:.1%} conf)")
@@ -171,7 +172,7 @@ def analyze_game_predictions():
         print(f"\nFound {len(close_calls)} toss-up games")
         print(f"Accuracy on these: {close_calls['correct'].mean():.1%}\n")
         
-        for idx, game in close_calls.head(5).iterrows():
+        for game in close_calls.head(5).to_dict('records'):
             result = "✅" if game['correct'] else "❌"
             prob_str = f"{game['predicted_prob']:.1%} home"
             print(f"{result} Week {game['week']}: {game['away_team']} @ {game['home_team']}")
@@ -194,8 +195,8 @@ def analyze_game_predictions():
     
     print("\nWeek | Games | Accuracy | Avg Confidence")
     print("-" * 45)
-    for week, row in weekly_acc.iterrows():
-        print(f"{week:4.0f} | {row['games']:5.0f} | {row['correct']:7.1%} | {row['confidence']:7.1%}")
+    for row in weekly_acc.itertuples():
+        print(f"{row.Index:4.0f} | {row.games:5.0f} | {row.correct:7.1%} | {row.confidence:7.1%}")
     
     # ============================================================
     # STATISTICAL SUMMARY
@@ -18,6 +18,32 @@ from src.database.connection import DatabaseConnection
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Matchup features as (name, left column, right column, fill for missing values);
+# each is left - right. Only def_ypp_diff tolerates its columns being absent (0 then)
+MATCHUP_FEATURES = (
+    # Offensive vs Defensive matchup
+    ('ppg_vs_papg', 'home_ppg_3wk', 'away_papg_3wk', 0),
+    ('papg_vs_ppg', 'home_papg_3wk', 'away_ppg_3wk', 0),
+    # Overall strength differential
+    ('margin_diff', 'home_margin_3wk', 'away_margin_3wk', 0),
+    ('margin_diff_5wk', 'home_margin_5wk', 'away_margin_5wk', 0),
+    # Efficiency differential
+    ('ypp_diff', 'home_ypp_3wk', 'away_ypp_3wk', 0),
+    # Defensive efficiency
+    ('def_ypp_diff', 'away_opp_ypp_3wk', 'home_opp_ypp_3wk', 0),
+    # Momentum differential
+    ('streak_diff', 'home_win_streak', 'away_win_streak', 0),
+    ('trend_diff', 'home_margin_trend', 'away_margin_trend', 0),
+    # Turnover battle
+    ('turnover_diff', 'home_turnover_diff_3wk', 'away_turnover_diff_3wk', 0),
+    # Experience differential (games played this season)
+    ('experience_diff', 'home_games_in_season', 'away_games_in_season', 0),
+    # Strength of schedule differential
+    ('sos_diff', 'home_sos_3wk', 'away_sos_3wk', 0.5),
+    # Style matchup (do opposites clash?) - absolute difference
+    ('style_contrast', 'home_pass_ratio_3wk', 'away_pass_ratio_3wk', 0.5),
+)
+
 class GameDataPrep:
     """
     Transforms database records into ML-ready feature matrices.
@@ -169,38 +195,29 @@ class GameDataPrep:
         Add features that compare the two teams directly.
         These "matchup" features often have strong predictive power.
         """
-        # Offensive vs Defensive matchup (handle NaN values)
-        df['ppg_vs_papg'] = df['home_ppg_3wk'].fillna(0) - df['away_papg_3wk'].fillna(0)
-        df['papg_vs_ppg'] = df['home_papg_3wk'].fillna(0) - df['away_ppg_3wk'].fillna(0)
-        
-        # Overall strength differential
-        df['margin_diff'] = df['home_margin_3wk'].fillna(0) - df['away_margin_3wk'].fillna(0)
-        df['margin_diff_5wk'] = df['home_margin_5wk'].fillna(0) - df['away_margin_5wk'].fillna(0)
-        
-        # Efficiency differential
-        df['ypp_diff'] = df['home_ypp_3wk'].fillna(0) - df['away_ypp_3wk'].fillna(0)
-        
-        # Defensive efficiency (check if columns exist first)
-        if 'home_opp_ypp_3wk' in df.columns and 'away_opp_ypp_3wk' in df.columns:
-            df['def_ypp_diff'] = df['away_opp_ypp_3wk'].fillna(0) - df['home_opp_ypp_3wk'].fillna(0)
-        else:
-            df['def_ypp_diff'] = 0
-        
-        # Momentum differential
-        df['streak_diff'] = df['home_win_streak'].fillna(0) - df['away_win_streak'].fillna(0)
-        df['trend_diff'] = df['home_margin_trend'].fillna(0) - df['away_margin_trend'].fillna(0)
-        
-        # Turnover battle
-        df['turnover_diff'] = df['home_turnover_diff_3wk'].fillna(0) - df['away_turnover_diff_3wk'].fillna(0)
+        names = [name for name, _, _, _ in MATCHUP_FEATURES]
+        missing = [
+            col for name, left_col, right_col, _ in MATCHUP_FEATURES if name != 'def_ypp_diff'
+            for col in (left_col, right_col) if col not in df.columns
+        ]
+        if missing:
+            raise KeyError(missing)
+        fills = np.array([fill for _, _, _, fill in MATCHUP_FEATURES], dtype=float)
         
-        # Experience differential (games played this season)
-        df['experience_diff'] = df['home_games_in_season'].fillna(0) - df['away_games_in_season'].fillna(0)
+        # Both sides of every feature as one float block each, NaN filled per feature
+        left = df.reindex(columns=[left for _, left, _, _ in MATCHUP_FEATURES]).to_numpy(dtype=float)
+        right = df.reindex(columns=[right for _, _, right, _ in MATCHUP_FEATURES]).to_numpy(dtype=float)
+        left = np.where(np.isnan(left), fills, left)
+        right = np.where(np.isnan(right), fills, right)
         
-        # Strength of schedule differential
-        df['sos_diff'] = df['home_sos_3wk'].fillna(0.5) - df['away_sos_3wk'].fillna(0.5)
+        diffs = left - right
+        def_ypp = names.index('def_ypp_diff')
+        if 'home_opp_ypp_3wk' not in df.columns or 'away_opp_ypp_3wk' not in df.columns:
+            diffs[:, def_ypp] = 0
+        contrast = names.index('style_contrast')
+        diffs[:, contrast] = np.abs(diffs[:, contrast])
         
-        # Style matchup (do opposites clash?)
-        df['style_contrast'] = abs(df['home_pass_ratio_3wk'].fillna(0.5) - df['away_pass_ratio_3wk'].fillna(0.5))
+        df[names] = diffs
         
         # Count actual matchup features created
         matchup_features = [col for col in df.columns if 'diff' in col or 'vs' in col or 'contrast' in col]
@@ -235,17 +252,23 @@ class GameDataPrep:
         feature_cols.extend(matchup_cols)
         
         # Extract features, handling any missing columns gracefully
-        available_cols = [col for col in feature_cols if col in df.columns]
-        missing_cols = [col for col in feature_cols if col not in df.columns]
+        present = set(df.columns)
+        available_cols = []
+        missing_cols = []
+        for col in feature_cols:
+            if col in present:
+                available_cols.append(col)
+            else:
+                missing_cols.append(col)
         
         if missing_cols:
             logger.warning(f"Missing {len(missing_cols)} features: {missing_cols[:5]}...")
         
-        # Get the data and convert to float explicitly
-        X = df[available_cols].values.astype(float)
+        # Get the data as float in one conversion
+        X = df[available_cols].to_numpy(dtype=float)
         
         # Handle missing values (NaN -> 0 for now, could be more sophisticated)
-        X = np.nan_to_num(X, nan=0.0)
+        X = np.nan_to_num(X, nan=0.0, copy=False)
         
         logger.info(f"Created feature matrix: {X.shape} ({X.shape[0]} games, {X.shape[1]} features)")
         
@@ -137,8 +137,7 @@ def evaluate_week(year: int, week: int, model_name: str = None, model_version: s
     # Biggest upsets (high confidence misses)
     print(f"\nBiggest Misses (High Confidence Incorrect):")
     misses = df[~df['was_correct']].head(5)
-    for i, row in enumerate(misses.iterrows(), 1):
-        row = row[1]
+    for i, row in enumerate(misses.to_dict('records'), 1):
         print(f"\n{i}. {row['away_team']} @ {row['home_team']}")
         print(f"   Predicted: {row['predicted_winner']} ({row['confidence']:.1%} confidence)")
         print(f"   Actual: {row['actual_winner']} won {row['home_score']}-{row['away_score']}")
@@ -146,8 +145,7 @@ def evaluate_week(year: int, week: int, model_name: str = None, model_version: s
     # Best predictions (high confidence correct)
     print(f"\nBest Predictions (High Confidence Correct):")
     best = df[df['was_correct']].head(5)
-    for i, row in enumerate(best.iterrows(), 1):
-        row = row[1]
+    for i, row in enumerate(best.to_dict('records'), 1):
         print(f"\n{i}. {row['away_team']} @ {row['home_team']}")
         print(f"   Predicted: {row['predicted_winner']} ({row['confidence']:.1%} confidence)")
         print(f"   Actual: {row['actual_winner']} won {row['home_score']}-{row['away_score']}")
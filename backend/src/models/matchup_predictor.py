@@ -12,9 +12,8 @@ Unlike WeeklyPredictor, this doesn't re-run the training pipeline.
 import joblib
 import logging
 import numpy as np
-import pandas as pd
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
@@ -69,37 +68,43 @@ class MatchupPredictor:
         
         Returns None if team has no stats (new team, no games played yet).
         """
+        return self.get_latest_rolling_stats_many(db, [team_id]).get(team_id)
+    
+    def get_team_info(self, db: Session, team_id: int) -> Optional[Dict]:
+        """Fetch basic team info for response."""
+        return self.get_teams_info(db, [team_id]).get(team_id)
+    
+    def get_latest_rolling_stats_many(self, db: Session, team_ids: List[int]) -> Dict[int, Dict]:
+        """
+        Newest stats for several teams in one query.
+        
+        Returns a dict of team_id -> stats; teams without stats are left out.
+        """
         query = text("""
-            SELECT trs.*
+            SELECT DISTINCT ON (trs.team_id) trs.*
             FROM team_rolling_stats trs
             JOIN games g ON trs.game_id = g.id
-            WHERE trs.team_id = :team_id
-            ORDER BY g.year DESC, g.week DESC
-            LIMIT 1
+            WHERE trs.team_id = ANY(:team_ids)
+            ORDER BY trs.team_id, g.year DESC, g.week DESC
         """)
         
-        result = db.execute(query, {'team_id': team_id})
-        row = result.fetchone()
+        result = db.execute(query, {'team_ids': list(team_ids)})
+        stats = {row.team_id: dict(row._mapping) for row in result}
         
-        if row:
-            return dict(row._mapping)
-        
-        logger.warning(f"No rolling stats found for team {team_id}")
-        return None
+        for team_id in team_ids:
+            if team_id not in stats:
+                logger.warning(f"No rolling stats found for team {team_id}")
+        return stats
     
-    def get_team_info(self, db: Session, team_id: int) -> Optional[Dict]:
-        """Fetch basic team info for response."""
+    def get_teams_info(self, db: Session, team_ids: List[int]) -> Dict[int, Dict]:
+        """Basic team info for several teams in one query: team_id -> info for every team that exists."""
         query = text("""
             SELECT id, name, slug, conference
             FROM teams
-            WHERE id = :team_id
+            WHERE id = ANY(:team_ids)
         """)
-        result = db.execute(query, {'team_id': team_id})
-        row = result.fetchone()
-        
-        if row:
-            return dict(row._mapping)
-        return None
+        result = db.execute(query, {'team_ids': list(team_ids)})
+        return {row.id: dict(row._mapping) for row in result}
     
     def _safe_get(self, stats: Dict, key: str, default: float = 0.0) -> float:
         """Safely extract numeric value from stats dict."""
@@ -218,20 +223,17 @@ class MatchupPredictor:
             self._safe_get(away_stats, 'pass_ratio_3wk', 0.5)
         )
         
-        # ---- Build DataFrame in correct feature order ----
-        df = pd.DataFrame([features])
-        
+        # ---- Build the feature row in the exact order the model expects ----
         # Ensure all expected features exist (fill missing with 0)
         for feature in self.feature_names:
-            if feature not in df.columns:
+            if feature not in features:
                 logger.warning(f"Missing feature: {feature}, filling with 0")
-                df[feature] = 0
-        
-        # Select in exact order model expects
-        df = df[self.feature_names]
+        row = np.array(
+            [[features.get(feature, 0) for feature in self.feature_names]], dtype=float
+        )
         
         # Apply normalization
-        scaled = self.scaler.transform(df.values)
+        scaled = self.scaler.transform(row)
         
         return scaled[0]
     
@@ -253,9 +255,11 @@ class MatchupPredictor:
         - confidence: float 0.5-1.0
         - error: str if something went wrong
         """
-        # Get team info
-        home_team = self.get_team_info(db, home_team_id)
-        away_team = self.get_team_info(db, away_team_id)
+        # Both teams' info, then both teams' stats, in one query each
+        team_ids = [home_team_id, away_team_id]
+        teams = self.get_teams_info(db, team_ids)
+        home_team = teams.get(home_team_id)
+        away_team = teams.get(away_team_id)
         
         if not home_team:
             return {'error': f'Home team {home_team_id} not found'}
@@ -263,8 +267,9 @@ class MatchupPredictor:
             return {'error': f'Away team {away_team_id} not found'}
         
         # Get rolling stats
-        home_stats = self.get_latest_rolling_stats(db, home_team_id)
-        away_stats = self.get_latest_rolling_stats(db, away_team_id)
+        stats = self.get_latest_rolling_stats_many(db, team_ids)
+        home_stats = stats.get(home_team_id)
+        away_stats = stats.get(away_team_id)
         
         if not home_stats:
             return {
@@ -77,12 +77,12 @@ def test_on_2024():
         print(f"  Accuracy on these: {high_conf_acc:.1%}")
     
     # Week by week
-    df = pd.DataFrame({'week': [g.week for g in df.itertuples()], 'correct': (y_pred == y_test)})
+    df = pd.DataFrame({'week': df['week'].to_numpy(), 'correct': (y_pred == y_test)})
     weekly = df.assign(correct=(y_pred == y_test)).groupby('week')['correct'].agg(['mean', 'count'])
     
     print(f"\n📅 Week-by-week accuracy:")
-    for week, row in weekly.iterrows():
-        print(f"  Week {week}: {row['mean']:.1%} ({int(row['count'])} games)")
+    for week, mean, count in zip(weekly.index, weekly['mean'], weekly['count']):
+        print(f"  Week {week}: {mean:.1%} ({int(count)} games)")
     
     print("\n" + "="*60)
     if accuracy > 0.7:
@@ -258,9 +258,10 @@ class LogisticRegressionBaseline:
         print(f"\n📈 Top {top_n} Most Important Features:")
         print("(Positive = favors home team, Negative = favors away team)\n")
         
-        for idx, row in feature_importance.head(top_n).iterrows():
-            direction = "→ HOME" if row['coefficient'] > 0 else "→ AWAY"
-            print(f"  {row['feature']:30s}: {row['coefficient']:+.4f} {direction}")
+        top_features = feature_importance.head(top_n)
+        for feature, coefficient in zip(top_features['feature'], top_features['coefficient']):
+            direction = "→ HOME" if coefficient > 0 else "→ AWAY"
+            print(f"  {feature:30s}: {coefficient:+.4f} {direction}")
         
         # Insight analysis
         self._analyze_feature_patterns(feature_importance)
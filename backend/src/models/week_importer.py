@@ -90,15 +90,17 @@ class WeekImporter:
         
         return success
     
-    def recalculate_stats(self, year: int) -> bool:
+    def recalculate_stats(self, year: int, weeks: List[int]) -> bool:
         """
         Recalculate rolling stats after imports.
         
-        We recalculate the full year to ensure consistency.
+        Only games from the earliest imported week onwards can change, so
+        earlier weeks keep their stored stats.
         """
+        start_week = min(weeks)
         try:
-            print(f"\nRecalculating rolling stats for {year}...")
-            self.stats_calc.calculate_for_all_games(year, year)
+            print(f"\nRecalculating rolling stats for {year} from week {start_week}...")
+            self.stats_calc.calculate_for_all_games(year, year, start_week=start_week)
             print(f"✅ Rolling stats updated for {year}")
             return True
         except Exception as e:
@@ -140,7 +142,9 @@ class WeekImporter:
             )
             
             if import_success:
-                import_success = self.recalculate_stats(prev_year)
+                import_success = self.recalculate_stats(
+                    prev_year, report['previous_season_missing']
+                )
         
         # Import current season
         if report['current_season_missing'] and import_success:
@@ -151,7 +155,9 @@ class WeekImporter:
             )
             
             if import_success:
-                import_success = self.recalculate_stats(year)
+                import_success = self.recalculate_stats(
+                    year, report['current_season_missing']
+                )
         
         if import_success:
             print("\n✅ All imports complete! Ready for predictions.")
@@ -9,7 +9,6 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 import numpy as np
-import pandas as pd
 from sqlalchemy import text
 
 from src.database.teams_model import Team
@@ -249,27 +248,26 @@ class WeeklyPredictor:
             safe_get(away_stats, 'pass_ratio_3wk', 0.5)
         )
         
-        # Convert to DataFrame in correct order
-        df = pd.DataFrame([features_dict])
-        
-        # Ensure all expected features exist
-        for feature in self.feature_names:
-            if feature not in df.columns:
-                df[feature] = 0
-        
-        # Select features in correct order
-        df = df[self.feature_names]
+        # One row in the order the model expects (missing features are 0)
+        row = np.array(
+            [[features_dict.get(feature, 0) for feature in self.feature_names]], dtype=float
+        )
         
         # Apply normalization
-        features_scaled = self.scaler.transform(df.values)
+        features_scaled = self.scaler.transform(row)
         
         return features_scaled[0]
     
     def predict_game(self, home_team_id: int, away_team_id: int, 
-                year: int, week: int) -> Dict:
+                year: int, week: int,
+                team_names: Optional[Dict[int, str]] = None) -> Dict:
         """
         Generate prediction for a single game.
         
+        Args:
+            team_names: Optional team_id -> name lookup (see predict_week());
+                names are queried per team when omitted
+        
         Returns dict with prediction details or error message.
         """
         # Helper function to safely get numeric values
@@ -280,11 +278,15 @@ class WeeklyPredictor:
         
         with self.db.get_session() as session:
             # Get team names first
-            home_team = self.team_manager.get_team_by_id(session, home_team_id)
-            away_team = self.team_manager.get_team_by_id(session, away_team_id)
-            
-            home_name = home_team.name if home_team else 'Unknown'
-            away_name = away_team.name if away_team else 'Unknown'
+            if team_names is not None:
+                home_name = team_names.get(home_team_id, 'Unknown')
+                away_name = team_names.get(away_team_id, 'Unknown')
+            else:
+                home_team = self.team_manager.get_team_by_id(session, home_team_id)
+                away_team = self.team_manager.get_team_by_id(session, away_team_id)
+                
+                home_name = home_team.name if home_team else 'Unknown'
+                away_name = away_team.name if away_team else 'Unknown'
             
             # Get rolling stats for both teams
             home_stats = self._get_latest_rolling_stats(home_team_id, year, week)
@@ -361,12 +363,20 @@ class WeeklyPredictor:
             print(f"No upcoming games found for Week {week}")
             return []
         
+        # One query for every team's name instead of two per game
+        team_ids = {g['home_team_id'] for g in games} | {g['away_team_id'] for g in games}
+        with self.db.get_session() as session:
+            team_names = dict(
+                session.query(Team.id, Team.name).filter(Team.id.in_(team_ids)).all()
+            )
+        
         predictions = []
         for game in games:
             prediction = self.predict_game(
                 game['home_team_id'],
                 game['away_team_id'],
-                year, week
+                year, week,
+                team_names=team_names
             )
             prediction['game_date'] = game['game_date']
             prediction['year'] = year  # ADD THIS
@@ -258,7 +258,7 @@ class GameImporter:
         session.add(game)
         session.flush()  # Get the game.id without committing
         
-        logger.debug(f"Created game record #{game.id} for contest {game.contest_id}")
+        logger.debug("Created game record #%s for contest %s", game.id, game.contest_id)
         return game
 
     def _create_team_stats_records(
@@ -294,7 +294,7 @@ class GameImporter:
                 **self._map_stats_fields(home_stats)
             )
             session.add(home_record)
-            logger.debug(f"Created home team stats for team {home_team_id}")
+            logger.debug("Created home team stats for team %s", home_team_id)
 
         # Create away team stats
         if away_stats:
@@ -307,7 +307,7 @@ class GameImporter:
                 **self._map_stats_fields(away_stats)
             )
             session.add(away_record)
-            logger.debug(f"Created away team stats for team {away_team_id}")
+            logger.debug("Created away team stats for team %s", away_team_id)
 
     def _map_stats_fields(self, stats: Dict) -> Dict:
         """
@@ -6,14 +6,202 @@ Handles the two main queries we need:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
 import time
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, fields as dataclass_fields
 import logging
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import Any, Dict, Optional
+from datetime import timedelta
 
 logger = logging.getLogger(__name__)
 
+
+# How team stats are flattened: (teamStats sub-section or None for the top level,
+# ((our field name, NCAA field name), ...)). Order here is the order of the output keys.
+_STAT_SCHEMA = (
+    (None, (
+        # Basic stats
+        ('first_downs', 'firstDowns'),
+        ('first_downs_passing', 'firstDownsPassing'),
+        ('first_downs_rushing', 'firstDownsRushing'),
+        ('first_downs_penalty', 'firstDownsPenalty'),
+        # Third/Fourth down conversions
+        ('third_down_conversions', 'thirdDowns'),
+        ('third_down_attempts', 'thirdDownAttempts'),
+        ('fourth_down_conversions', 'fourthDowns'),
+        ('fourth_down_attempts', 'fourthDownAttempts'),
+        # Turnovers
+        ('fumbles', 'fumbles'),
+        ('fumbles_lost', 'fumblesLost'),
+        # Penalties
+        ('penalties', 'penalty'),
+        ('penalty_yards', 'penaltyYards'),
+        # Total offense
+        ('total_plays', 'teamPlays'),
+        ('total_yards', 'teamYards'),
+        ('yards_per_play', 'teamAverage'),
+    )),
+    ('TeamPassingStats', (
+        ('passing_attempts', 'passingAttempts'),
+        ('passing_completions', 'passingCompletions'),
+        ('passing_yards', 'passingYards'),
+        ('passing_tds', 'passingTDs'),
+        ('passing_interceptions', 'passingInterceptions'),
+        ('passing_long', 'passingLong'),
+    )),
+    ('TeamRushingStats', (
+        ('rushing_attempts', 'rushingAttempts'),
+        ('rushing_yards', 'rushingYards'),
+        ('rushing_tds', 'rushingTDs'),
+        ('rushing_long', 'rushingLong'),
+    )),
+    ('TeamDefenseStats', (
+        ('defense_interceptions', 'defenseInterceptions'),
+        ('fumbles_forced', 'fumblesForced'),
+        ('fumbles_recovered', 'fumblesRecovered'),
+        ('sacks', 'sacks'),
+        ('tackles_for_loss', 'lossTackles'),
+        ('total_tackles', 'totalTackles'),
+    )),
+    ('TeamPuntingStats', (
+        ('punts', 'puntingPunts'),
+        ('punt_yards', 'puntingYards'),
+        ('punt_average', 'puntingAverage'),
+    )),
+    ('TeamKickReturnsStats', (
+        ('kick_returns', 'kickReturns'),
+        ('kick_return_yards', 'kickReturnYards'),
+        ('kick_return_average', 'kickReturnAverage'),
+    )),
+    ('TeamPuntReturnsStats', (
+        ('punt_returns', 'puntReturns'),
+        ('punt_return_yards', 'puntReturnYards'),
+        ('punt_return_average', 'puntReturnAverage'),
+    )),
+)
+
+# Responses that mean the server wants us to slow down
+_THROTTLE_STATUSES = (429, 503)
+
+
+def _retry_after_seconds(value: Optional[str]) -> float:
+    """Seconds from a Retry-After header (delta-seconds form); 0 if absent or unparseable."""
+    try:
+        return max(0.0, float(value)) if value else 0.0
+    except ValueError:
+        return 0.0
+
+
+# Shared stand-in for a missing stats section (never mutated)
+_EMPTY: Dict = {}
+
+
+@dataclass(slots=True)
+class ParsedTeamStats(Mapping):
+    """
+    One team's flattened stats for one game (an entry of get_game_stats()['team_stats']).
+    
+    Slotted, so thousands of these take far less memory than dicts. Values are
+    kept as NCAA sends them (usually strings). It also behaves as a read-only
+    mapping (get(), [], items(), len()) so dict-based callers keep working.
+    """
+    team_id: Optional[int]
+    team_name: str
+    is_home: bool
+
+    # Basic stats
+    first_downs: Optional[Any] = None
+    first_downs_passing: Optional[Any] = None
+    first_downs_rushing: Optional[Any] = None
+    first_downs_penalty: Optional[Any] = None
+    # Third/Fourth down conversions
+    third_down_conversions: Optional[Any] = None
+    third_down_attempts: Optional[Any] = None
+    fourth_down_conversions: Optional[Any] = None
+    fourth_down_attempts: Optional[Any] = None
+    # Turnovers
+    fumbles: Optional[Any] = None
+    fumbles_lost: Optional[Any] = None
+    # Penalties
+    penalties: Optional[Any] = None
+    penalty_yards: Optional[Any] = None
+    # Total offense
+    total_plays: Optional[Any] = None
+    total_yards: Optional[Any] = None
+    yards_per_play: Optional[Any] = None
+    # Passing
+    passing_attempts: Optional[Any] = None
+    passing_completions: Optional[Any] = None
+    passing_yards: Optional[Any] = None
+    passing_tds: Optional[Any] = None
+    passing_interceptions: Optional[Any] = None
+    passing_long: Optional[Any] = None
+    # Rushing
+    rushing_attempts: Optional[Any] = None
+    rushing_yards: Optional[Any] = None
+    rushing_tds: Optional[Any] = None
+    rushing_long: Optional[Any] = None
+    # Defense
+    defense_interceptions: Optional[Any] = None
+    fumbles_forced: Optional[Any] = None
+    fumbles_recovered: Optional[Any] = None
+    sacks: Optional[Any] = None
+    tackles_for_loss: Optional[Any] = None
+    total_tackles: Optional[Any] = None
+    # Punting
+    punts: Optional[Any] = None
+    punt_yards: Optional[Any] = None
+    punt_average: Optional[Any] = None
+    # Kick returns
+    kick_returns: Optional[Any] = None
+    kick_return_yards: Optional[Any] = None
+    kick_return_average: Optional[Any] = None
+    # Punt returns
+    punt_returns: Optional[Any] = None
+    punt_return_yards: Optional[Any] = None
+    punt_return_average: Optional[Any] = None
+
+    def __getitem__(self, key: str):
+        if key not in _PARSED_FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(_PARSED_FIELD_NAMES)
+
+    def __len__(self) -> int:
+        return len(_PARSED_FIELD_NAMES)
+
+    def to_dict(self) -> Dict:
+        """Plain dict copy, in the same key order the old parser produced."""
+        return {name: getattr(self, name) for name in _PARSED_FIELD_NAMES}
+
+
+_PARSED_FIELD_NAMES = tuple(f.name for f in dataclass_fields(ParsedTeamStats))
+_PARSED_FIELD_SET = frozenset(_PARSED_FIELD_NAMES)
+
+# The only boxscore fields the parser reads
+_BOXSCORE_KEYS = ('contestId', 'description', 'status', 'period', 'teams', 'teamBoxscore')
+
+
+def _project_boxscore(data: dict) -> Optional[dict]:
+    """
+    Keep just the boxscore fields we use from a decoded stats response.
+    Once the caller drops the full document, the rest of the parse tree
+    can be freed before any per-team work starts.
+    """
+    boxscore = (data.get('data') or _EMPTY).get('boxscore')
+    if not boxscore:
+        return boxscore
+    return {key: boxscore[key] for key in _BOXSCORE_KEYS if key in boxscore}
+
+
 class NCAAAPIClient:
     """
     Clean interface to NCAA's GraphQL API for D3 football data.
@@ -22,14 +210,27 @@ class NCAAAPIClient:
     All data transformation happens in other modules.
     """
 
-    def __init__(self, delay : float = 1.0):
+    def __init__(self, delay : float = 1.0,
+                 cache_path: Optional[str] = None,
+                 burst: int = 1):
         """
         Initialize the API client with rate limiting.
         
         Args:
             delay: Seconds to wait between API calls (be respectful!)
+            burst: Calls allowed back-to-back before `delay` spacing kicks in
+            cache_path: Optional SQLite file for an on-disk response cache
+                (requires requests-cache). Only finished games stay cached.
         """
         self.delay = delay
+        # Adaptive backoff (see _record_status) moves `delay` between these bounds
+        self._base_delay = delay
+        self._max_delay = 30.0
+        self._ok_streak = 0
+        # Monotonic time before which no request should start (from Retry-After)
+        self._resume_at = 0.0
+        # Responses actually received from the server (cache hits and skipped games excluded)
+        self.requests_sent = 0
         self.base_url = "https://sdataprod.ncaa.com/" 
         
         #headers to make look like a normal browser request
@@ -37,27 +238,221 @@ class NCAAAPIClient:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'application/json'
         }
+        
+        # One session for every call: headers are set once and connections are reused
+        self.session = self._create_session(cache_path)
+        self.session.headers.update(self.headers)
+        
+        # Pool connections and retry transient server errors with exponential backoff
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False  # let _observe() see a final 429/503
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.timeout = (5, 15)  # (connect, read) seconds
 
         # Query hash for the GetContests GraphQL query (found in your examples)
         self.contests_query_hash = "c1bd3e9f56889ebca2937ecf24a2d62ccbe771939687b5ef258a51a2110c1d57"
         self.team_stats_query_hash = "b41348ee662d9236483167395b16bb6ab36b12e2908ef6cd767685ea8a2f59bd"
+
+        # The persisted query extensions never change, so serialize them once
+        self._contests_ext_json = orjson.dumps(
+            {"persistedQuery": {"version": 1, "sha256Hash": self.contests_query_hash}}
+        ).decode()
+        self._team_stats_ext_json = orjson.dumps(
+            {"persistedQuery": {"version": 1, "sha256Hash": self.team_stats_query_hash}}
+        ).decode()
+        self._contests_base_vars = {"sportCode": "MFB", "division": 3}
+
+        # Everything but the per-call variables is fixed for each query
+        self._contests_base_params = {
+            "meta": "GetContests_web",
+            "extensions": self._contests_ext_json,
+            "queryName": "GetContests_web",
+        }
+        self._stats_base_params = {
+            "meta": "NCAA_GetGamecenterTeamStatsFootballById_web",
+            "extensions": self._team_stats_ext_json,
+            "queryName": "NCAA_GetGamecenterTeamStatsFootballById_web",
+        }
+        
+        # Token bucket: refills one token every `delay` seconds, holds at most `burst`
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        # Fetches may run from a thread pool; the lock keeps the bucket consistent
+        self._rate_lock = threading.Lock()
+
+        # In-process LRU of final game stats: contest_id -> get_game_stats() result
+        self._stats_cache: OrderedDict = OrderedDict()
+        self._stats_cache_size = 2048
+        self._stats_cache_lock = threading.Lock()
+
+    def _create_session(self, cache_path: Optional[str]) -> requests.Session:
+        """
+        Build the HTTP session, backed by requests-cache when a cache path is given.
         
-        self.last_request_time = 0
+        The persisted query hash and variables live in the URL query string, so
+        they form the cache key on their own.
+        """
+        if not cache_path:
+            return requests.Session()
+
+        try:
+            from requests_cache import CachedSession
+        except ImportError:
+            logger.warning("requests-cache is not installed; continuing without a response cache")
+            return requests.Session()
+
+        logger.info(f"Using NCAA response cache at {cache_path}")
+        return CachedSession(
+            cache_path,
+            backend='sqlite',
+            expire_after=timedelta(days=30),
+            allowable_codes=(200,),
+            cache_control=False
+        )
+
+    def _uncache(self, response):
+        """
+        Drop a response from the on-disk cache. Used for data that can still
+        change (unfinished games), so the next call goes back to the network.
+        """
+        cache = getattr(self.session, 'cache', None)
+        if cache is None or getattr(response, 'from_cache', False):
+            return
+        try:
+            cache.delete(requests=[response.request])
+        except Exception as e:
+            logger.debug(f"Could not drop cached response: {e}")
+
+    def clear_expired_cache(self):
+        """Remove expired entries from the on-disk response cache, if enabled."""
+        cache = getattr(self.session, 'cache', None)
+        if cache is not None:
+            cache.delete(expired=True)
+
+    def _cached_stats(self, contest_id) -> Optional[dict]:
+        """Return memoized stats for a game, or None if we haven't kept them."""
+        key = str(contest_id)
+        with self._stats_cache_lock:
+            result = self._stats_cache.get(key)
+            if result is not None:
+                self._stats_cache.move_to_end(key)
+            return result
+
+    def _remember_stats(self, contest_id, result: dict):
+        """Memoize a final game's stats, evicting the least recently used entry."""
+        if not result.get('success') or result.get('status') != 'F':
+            return
+        with self._stats_cache_lock:
+            self._stats_cache[str(contest_id)] = result
+            self._stats_cache.move_to_end(str(contest_id))
+            if len(self._stats_cache) > self._stats_cache_size:
+                self._stats_cache.popitem(last=False)
+
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _rate_limit(self):
         """
         Ensure we don't hammer the NCAA API(don't want to get blocked).
-        Waits if necessary to maintain our delay between requests.
+        Token bucket: up to `burst` calls go straight through, after that
+        calls wait so the long-run rate stays at one per `delay` seconds.
+        Safe to call from several threads at once.
         """
-        current_time=time.time()
-        time_since_last = current_time - self.last_request_time
+        pause = self._resume_at - time.monotonic()
+        if pause > 0:
+            logger.info("Server asked us to back off: sleeping %.1f seconds", pause)
+            time.sleep(pause)
+
+        if self.delay <= 0:
+            return
+
+        # Claim a token under the lock (possibly going into debt), then sleep
+        # outside it so other threads can still record responses meanwhile
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) / self.delay)
+            self._last_refill = now
+            self._tokens -= 1
+            sleep_time = -self._tokens * self.delay
 
-        if time_since_last < self.delay:
-            sleep_time = self.delay - time_since_last
-            logger.debug(f"Rate Limiting: sleeping {sleep_time:.1f} seconds")
+        if sleep_time > 0:
+            logger.debug("Rate Limiting: sleeping %.1f seconds", sleep_time)
             time.sleep(sleep_time)
 
-        self.last_request_time = time.time()
+    def _record_status(self, status: int, retry_after: Optional[str] = None):
+        """
+        Adapt request spacing to how the server is coping (AIMD): double
+        `delay` on a 429/503 and honour its Retry-After, then ease it back
+        towards the configured delay after every 100 straight successes.
+        Every call is one request that reached the server.
+        """
+        with self._rate_lock:
+            self.requests_sent += 1
+            if status in _THROTTLE_STATUSES:
+                self._ok_streak = 0
+                self.delay = min(max(self.delay * 2, 1.0), self._max_delay)
+                logger.warning("Throttled (%s): now one request per %.1fs", status, self.delay)
+                pause = _retry_after_seconds(retry_after)
+                if pause:
+                    self._resume_at = max(self._resume_at, time.monotonic() + pause)
+            elif 200 <= status < 300 and self.delay > self._base_delay:
+                self._ok_streak += 1
+                if self._ok_streak >= 100:
+                    self._ok_streak = 0
+                    self.delay = max(self.delay * 0.9, self._base_delay)
+                    logger.info("Easing off backoff: one request per %.1fs", self.delay)
+
+    def _observe(self, response: requests.Response):
+        """
+        Feed a sync response into _record_status(), including any 429/503s
+        urllib3 already retried through. Cache hits never reached the server.
+        """
+        if getattr(response, 'from_cache', False):
+            return
+        retries = getattr(response.raw, 'retries', None)
+        for attempt in getattr(retries, 'history', ()):
+            if attempt.status is not None:
+                self._record_status(attempt.status)
+        self._record_status(response.status_code, response.headers.get('Retry-After'))
+
+    def _week_params(self, year: int, week: int) -> dict:
+        """Build the GetContests query parameters for one week."""
+        variables = {
+            **self._contests_base_vars,
+            "seasonYear": year,
+            "contestDate": None,
+            "week": week
+        }
+
+        return {**self._contests_base_params, "variables": orjson.dumps(variables).decode()}
+
+    def _parse_week(self, data: dict, year: int, week: int) -> dict:
+        """Turn a decoded GetContests response into the get_week_games() result."""
+        contests = data.get('data', {}).get('contests', [])
+
+        logger.info(f"Successfully fetched {len(contests)} games for Week {week}")
+
+        return {
+            'success': True,
+            'games': contests,
+            'year': year,
+            'week': week
+        }
 
     def get_week_games(self, year: int, week: int) -> dict:
         """
@@ -73,48 +468,26 @@ class NCAAAPIClient:
                 - 'games': List of game dictionaries
                 - 'error': Error message if failed
         """
-        self._rate_limit
+        self._rate_limit()
 
         # Build the GraphQL query parameters
-        variables = {
-            "sportCode": "MFB",
-            "division": 3,
-            "seasonYear": year,
-            "contestDate": None,
-            "week": week
-        }
-
-        extensions = {
-            "persistedQuery": {
-                "version": 1,
-                "sha256Hash": self.contests_query_hash
-            }
-        }
-
-        params = {
-            "meta": "GetContests_web",
-            "extensions": json.dumps(extensions, separators=(',', ':')),
-            "queryName": "GetContests_web", 
-            "variables": json.dumps(variables, separators=(',', ':'))
-        }
+        params = self._week_params(year, week)
 
         logger.info(f"Fetching games for {year} Week {week}")
 
         try:
-            response = requests.get(self.base_url, params = params, headers = self.headers)
+            response = self.session.get(self.base_url, params = params, timeout=self.timeout)
+            self._observe(response)
             response.raise_for_status()
 
-            data = response.json()
-            contests = data.get('data', {}).get('contests', [])
+            data = orjson.loads(response.content)
+            result = self._parse_week(data, year, week)
 
-            logger.info(f"Successfully fetched {len(contests)} games for Week {week}")
+            # Schedules with unfinished games will change - don't keep them cached
+            if any(g.get('gameState') != 'F' for g in result['games']):
+                self._uncache(response)
 
-            return {
-                'success': True,
-                'games': contests,
-                'year': year,
-                'week': week
-            }
+            return result
         except requests.RequestException as e:
             logger.error(f"API request failed for {year} Week {week}: {e}")
             return {
@@ -130,12 +503,96 @@ class NCAAAPIClient:
                 'error': f"Invalid JSON: {e}"
             }
             
-    def get_game_stats(self, contest_id: int) -> dict:
+    def _stats_params(self, contest_id: int) -> dict:
+        """Build the team stats query parameters for one game."""
+        variables = {
+            "contestId": str(contest_id),
+            "staticTestEnv": None
+        }
+        
+        return {**self._stats_base_params, "variables": orjson.dumps(variables).decode()}
+
+    def _parse_boxscore(self, boxscore: Optional[dict], contest_id: int) -> dict:
+        """
+        Turn a projected boxscore (see _project_boxscore) into the
+        get_game_stats() result. Pure parsing, no I/O.
+        """
+
+        # Handle unplayed games (boxscore is None) allows for import before games have happened
+        if not boxscore:  # Catches both None and {}
+            logger.info(f"Game {contest_id} not yet played (no boxscore)")
+            return {
+                'success': True,  # Success, just unplayed
+                'contest_id': contest_id,
+                'is_upcoming': True,  # Flag for unplayed game
+                'teams': []
+            }
+
+        # Extract the key information
+        result = {
+            'success': True,
+            'contest_id': boxscore.get('contestId'),
+            'description': boxscore.get('description'),  # "Team A vs Team B"
+            'status': boxscore.get('status'),  # "F" for final
+            'period': boxscore.get('period'),  # "FINAL"
+            'teams': boxscore.get('teams', []),  # Team info with names, colors, etc.
+            'team_stats': []  # Will populate with parsed stats
+        }
+
+        # Index team info by id once; teams carry string ids, boxscores carry ints
+        teams_by_id = {}
+        for team in result['teams']:
+            teams_by_id.setdefault(int(team.get('teamId', 0)), team)
+
+        for team_boxscore in boxscore.get('teamBoxscore', []):
+            team_id = team_boxscore.get('teamId')
+            stats = team_boxscore.get('teamStats', {})
+
+            # Find the corresponding team info
+            team_info = teams_by_id.get(team_id, {})
+            
+            # Flatten the nested stats structure in one pass over the schema
+            parsed_stats = ParsedTeamStats(
+                team_id=team_id,
+                team_name=team_info.get('nameShort', 'Unknown'),
+                is_home=team_info.get('isHome', False),
+            )
+            for section_key, fields in _STAT_SCHEMA:
+                section = stats if section_key is None else (stats.get(section_key) or _EMPTY)
+                for out_key, ncaa_key in fields:
+                    setattr(parsed_stats, out_key, section.get(ncaa_key))
+            
+            result['team_stats'].append(parsed_stats)
+        
+        logger.info(f"Successfully parsed stats for game {contest_id}: {result['description']}")
+        return result
+
+    def _skipped_stats(self, contest_id, known_status: Optional[str]) -> Optional[dict]:
+        """
+        Stub result for a game the schedule already says isn't final, so
+        callers can skip the boxscore request. Shaped like an upcoming game.
+        """
+        if not known_status or known_status == 'F':
+            return None
+        logger.debug("Game %s has status %s, skipping stats fetch", contest_id, known_status)
+        return {
+            'success': True,
+            'contest_id': contest_id,
+            'status': known_status,
+            'is_upcoming': True,
+            'skipped': True,
+            'teams': [],
+            'team_stats': []
+        }
+
+    def get_game_stats(self, contest_id: int, *, known_status: Optional[str] = None) -> dict:
         """
         Fetch detailed statistics for a specific game.
         
         Args:
             contest_id: The NCAA contest ID (e.g., 6308940)
+            known_status: The game's 'gameState' from get_week_games(), if known.
+                Anything other than 'F' skips the request and returns a stub.
             
         Returns:
             Dict containing:
@@ -143,155 +600,39 @@ class NCAAAPIClient:
                 - 'stats': Dict with detailed team statistics
                 - 'error': Error message if failed
         """
+        skipped = self._skipped_stats(contest_id, known_status)
+        if skipped is not None:
+            return skipped
+
+        cached = self._cached_stats(contest_id)
+        if cached is not None:
+            logger.debug("Using memoized stats for game %s", contest_id)
+            return cached
+
         self._rate_limit()
 
         # Build the GraphQL query for team stats
-        variables = {
-            "contestId": str(contest_id),
-            "staticTestEnv": None
-        }
-        
-        extensions = {
-            "persistedQuery": {
-                "version": 1,
-                "sha256Hash": "b41348ee662d9236483167395b16bb6ab36b12e2908ef6cd767685ea8a2f59bd"
-            }
-        }
-        
-        params = {
-            "meta": "NCAA_GetGamecenterTeamStatsFootballById_web",  # Corrected
-            "extensions": json.dumps(extensions, separators=(',', ':')),
-            "queryName": "NCAA_GetGamecenterTeamStatsFootballById_web",  # Corrected
-            "variables": json.dumps(variables, separators=(',', ':'))
-        }
+        params = self._stats_params(contest_id)
         
         logger.info(f"Fetching stats for game {contest_id}")
 
         try:
-            response= requests.get(self.base_url, params = params, headers=self.headers)
+            response = self.session.get(self.base_url, params = params, timeout=self.timeout)
+            self._observe(response)
             response.raise_for_status()
 
-            data = response.json()
-
-            boxscore = data.get('data', {}).get('boxscore', {})
-
-            # Handle unplayed games (boxscore is None) allows for import before games have happened
-            if not boxscore:  # Catches both None and {}
-                logger.info(f"Game {contest_id} not yet played (no boxscore)")
-                return {
-                    'success': True,  # Success, just unplayed
-                    'contest_id': contest_id,
-                    'is_upcoming': True,  # Flag for unplayed game
-                    'teams': []
-                }
-
-            # Extract the key information
-            result = {
-                'success': True,
-                'contest_id': boxscore.get('contestId'),
-                'description': boxscore.get('description'),  # "Team A vs Team B"
-                'status': boxscore.get('status'),  # "F" for final
-                'period': boxscore.get('period'),  # "FINAL"
-                'teams': boxscore.get('teams', []),  # Team info with names, colors, etc.
-                'team_stats': []  # Will populate with parsed stats
-            }
+            # Parse straight from the raw bytes; avoids building response.text first
+            content = response.content
+            logger.debug("Game %s stats payload: %d bytes", contest_id, len(content))
+            boxscore = _project_boxscore(orjson.loads(content))
 
-            for team_boxscore in boxscore.get('teamBoxscore', []):
-                team_id = team_boxscore.get('teamId')
-                stats = team_boxscore.get('teamStats', {})
+            result = self._parse_boxscore(boxscore, contest_id)
 
-                # Find the corresponding team info
-                team_info = next((t for t in result['teams'] if int(t.get('teamId', 0)) == team_id), {})
-                
-                    # Flatten the nested stats structure
-                parsed_stats = {
-                    'team_id': team_id,
-                    'team_name': team_info.get('nameShort', 'Unknown'),
-                    'is_home': team_info.get('isHome', False),
-                    
-                    # Basic stats
-                    'first_downs': stats.get('firstDowns'),
-                    'first_downs_passing': stats.get('firstDownsPassing'),
-                    'first_downs_rushing': stats.get('firstDownsRushing'),
-                    'first_downs_penalty': stats.get('firstDownsPenalty'),
-                    
-                    # Third/Fourth down conversions
-                    'third_down_conversions': stats.get('thirdDowns'),
-                    'third_down_attempts': stats.get('thirdDownAttempts'),
-                    'fourth_down_conversions': stats.get('fourthDowns'),
-                    'fourth_down_attempts': stats.get('fourthDownAttempts'),
-                    
-                    # Turnovers
-                    'fumbles': stats.get('fumbles'),
-                    'fumbles_lost': stats.get('fumblesLost'),
-                    
-                    # Penalties
-                    'penalties': stats.get('penalty'),
-                    'penalty_yards': stats.get('penaltyYards'),
-                    
-                    # Total offense
-                    'total_plays': stats.get('teamPlays'),
-                    'total_yards': stats.get('teamYards'),
-                    'yards_per_play': stats.get('teamAverage'),
-                }
-                
-                # Add passing stats
-                passing = stats.get('TeamPassingStats', {})
-                parsed_stats.update({
-                    'passing_attempts': passing.get('passingAttempts'),
-                    'passing_completions': passing.get('passingCompletions'),
-                    'passing_yards': passing.get('passingYards'),
-                    'passing_tds': passing.get('passingTDs'),
-                    'passing_interceptions': passing.get('passingInterceptions'),
-                    'passing_long': passing.get('passingLong'),
-                })
-                
-                # Add rushing stats
-                rushing = stats.get('TeamRushingStats', {})
-                parsed_stats.update({
-                    'rushing_attempts': rushing.get('rushingAttempts'),
-                    'rushing_yards': rushing.get('rushingYards'),
-                    'rushing_tds': rushing.get('rushingTDs'),
-                    'rushing_long': rushing.get('rushingLong'),
-                })
-                
-                # Add defensive stats
-                defense = stats.get('TeamDefenseStats', {})
-                parsed_stats.update({
-                    'defense_interceptions': defense.get('defenseInterceptions'),
-                    'fumbles_forced': defense.get('fumblesForced'),
-                    'fumbles_recovered': defense.get('fumblesRecovered'),
-                    'sacks': defense.get('sacks'),
-                    'tackles_for_loss': defense.get('lossTackles'),
-                    'total_tackles': defense.get('totalTackles'),
-                })
-                
-                # Add special teams stats
-                punting = stats.get('TeamPuntingStats', {})
-                parsed_stats.update({
-                    'punts': punting.get('puntingPunts'),
-                    'punt_yards': punting.get('puntingYards'),
-                    'punt_average': punting.get('puntingAverage'),
-                })
-                
-                # Add return stats
-                kick_returns = stats.get('TeamKickReturnsStats', {})
-                parsed_stats.update({
-                    'kick_returns': kick_returns.get('kickReturns'),
-                    'kick_return_yards': kick_returns.get('kickReturnYards'),
-                    'kick_return_average': kick_returns.get('kickReturnAverage'),
-                })
-                
-                punt_returns = stats.get('TeamPuntReturnsStats', {})
-                parsed_stats.update({
-                    'punt_returns': punt_returns.get('puntReturns'),
-                    'punt_return_yards': punt_returns.get('puntReturnYards'),
-                    'punt_return_average': punt_returns.get('puntReturnAverage'),
-                })
-                
-                result['team_stats'].append(parsed_stats)
-            
-            logger.info(f"Successfully parsed stats for game {contest_id}: {result['description']}")
+            # Only a final boxscore is immutable; anything else gets refetched
+            if result.get('status') != 'F':
+                self._uncache(response)
+
+            self._remember_stats(contest_id, result)
             return result
                 
         except requests.RequestException as e:
@@ -1,6 +1,7 @@
 .3
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from datetime import datetime
 
@@ -36,17 +37,33 @@ class SimplePipeline:
     - ProgressTracker: Monitors everything
     """
 
-    def __init__(self, delay: float = 1.0):
-        """Initialize all pipeline components."""
+    def __init__(self, delay: float = 1.0, max_workers: int = 4,
+                 cache_path: Optional[str] = None, burst: int = 3):
+        """
+        Initialize all pipeline components.
+        
+        Args:
+            delay: Seconds between NCAA API calls
+            max_workers: Number of game stat fetches allowed in flight at once
+            cache_path: SQLite file for the NCAA response cache. If None, reads
+                NCAA_CACHE_PATH from the environment; unset means no cache.
+            burst: NCAA API calls allowed back-to-back before `delay` spacing
+                kicks in; the long-run rate stays one call per `delay`
+        """
         logger.info("Initializing pipeline components...")
         
+        # Re-running an import then reads finished games from disk instead of the API
+        cache_path = cache_path or os.getenv('NCAA_CACHE_PATH')
+        
         self.db = DatabaseConnection()
-        self.api_client = NCAAAPIClient(delay=delay)
+        self.api_client = NCAAAPIClient(delay=delay, cache_path=cache_path, burst=burst)
         self.translator = StatsTranslator()
         self.team_manager = TeamManager(self.db)
         self.game_importer = GameImporter(self.db, self.team_manager)
         self.progress = ProgressTracker()
         
+        self.max_workers = max_workers
+        
         # Performance tracking
         self.api_calls = 0
         self.start_time = None
@@ -65,12 +82,15 @@ class SimplePipeline:
         logger.info(f"{'='*50}")
         
         self.start_time = time.time()
+        # Expired responses would never be read again; keep the cache file from growing
+        self.api_client.clear_expired_cache()
+        # api_calls only counts requests that went out; skipped and cached games don't
+        sent_before = self.api_client.requests_sent
         
         try:
             # 1. Fetch week schedule
             logger.info("Fetching week schedule from NCAA...")
             week_data = self.api_client.get_week_games(year, week)
-            self.api_calls += 1
             
             if not week_data['success']:
                 error = f"Failed to fetch week: {week_data.get('error')}"
@@ -89,18 +109,15 @@ class SimplePipeline:
             with self.db.get_session() as session:
                 self.team_manager.bulk_ensure_teams(session, games)
             
-            # 3. Process each game
+            # 3. Decide which games need a stats fetch
             imported = 0
             skipped = 0
             failed = []
+            to_fetch = []
             
-            for i, game in enumerate(games, 1):
+            for game in games:
                 contest_id = str(game.get('contestId'))
                 
-                # Show progress every 10 games
-                if i % 10 == 0:
-                    logger.info(f"Progress: {i}/{len(games)} games processed")
-                
                 try:
                     # Check if game exists (avoid unnecessary API call)
                     with self.db.get_session() as session:
@@ -115,69 +132,96 @@ class SimplePipeline:
                                 # Game already has scores - true duplicate
                                 logger.debug(f"Game {contest_id} already exists with scores, skipping")
                                 skipped += 1
-                                
+                            
                                 if stop_on_duplicate:
                                     logger.info("Hit duplicate game, stopping week import")
                                     break
                                 continue
-                        
                     
-                    # Fetch detailed game stats
-                        game_stats = self.api_client.get_game_stats(contest_id)
-                        self.api_calls += 1
+                    to_fetch.append((contest_id, game))
+                    
+                except Exception as e:
+                    logger.error(f"Failed to import {contest_id}: {str(e)}")
+                    failed.append((contest_id, str(e)))
+                    self.progress.update_week_progress(game_failed=contest_id)
+            
+            # 4. Fetch stats concurrently (the client's rate limiter still spaces
+            # out requests), then translate and import on this thread in
+            # schedule order, so a duplicate stop never leaves earlier games
+            # unimported. Games the schedule says aren't final skip the
+            # request and come back as upcoming.
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    (executor.submit(
+                        self.api_client.get_game_stats, contest_id,
+                        known_status=game.get('gameState')
+                    ), contest_id, game)
+                    for contest_id, game in to_fetch
+                ]
+                
+                for i, (future, contest_id, game) in enumerate(futures, 1):
+                    
+                    # Show progress every 10 games
+                    if i % 10 == 0:
+                        logger.info(f"Progress: {i}/{len(to_fetch)} games processed")
+                    
+                    try:
+                        game_stats = future.result()
+
+                        #handle unplayed games
+                        if game_stats.get('is_upcoming'): 
+                            logger.info(f"Game {contest_id} is upcoming (no stats yet)")
+                            # Import just the schedule without stats
+                            translated = self.translator.translate_upcoming_game(game, week_number=week)
 
-                    #handle unplayed games
-                    if game_stats.get('is_upcoming'): 
-                        logger.info(f"Game {contest_id} is upcoming (no stats yet)")
-                        # Import just the schedule without stats
-                        translated = self.translator.translate_upcoming_game(game, week_number=week)
+                            # Validate and import
+                            is_valid, errors = self.translator.validate_translated_data(translated)
+                            if not is_valid:
+                                logger.error(f"Invalid data for {contest_id}: {errors}")
+                                failed.append((contest_id, f"Validation: {errors[0]}"))
+                                continue
+
+                            # Import to database (will have NULL scores)
+                            if self.game_importer.import_game(translated):
+                                imported += 1
+                                self.progress.update_week_progress(games_imported=1)
+                            continue     
 
-                        # Validate and import
+                        if not game_stats['success']:
+                            logger.warning(f"No stats for game {contest_id}")
+                            failed.append((contest_id, "No stats available"))
+                            self.progress.update_week_progress(game_failed=contest_id)
+                            continue
+                        
+                        # Translate to database format
+                        translated = self.translator.translate_game_for_db(
+                            game, game_stats, week_number=week
+                        )
+                        
+                        # Validate before import
                         is_valid, errors = self.translator.validate_translated_data(translated)
                         if not is_valid:
                             logger.error(f"Invalid data for {contest_id}: {errors}")
                             failed.append((contest_id, f"Validation: {errors[0]}"))
                             continue
-
-                        # Import to database (will have NULL scores)
+                        
+                        # Import to database
                         if self.game_importer.import_game(translated):
                             imported += 1
                             self.progress.update_week_progress(games_imported=1)
-                        continue     
-
-                    if not game_stats['success']:
-                        logger.warning(f"No stats for game {contest_id}")
-                        failed.append((contest_id, "No stats available"))
+                            
+                    except DuplicateGameError:
+                        skipped += 1
+                        if stop_on_duplicate:
+                            logger.info("Hit duplicate game, stopping")
+                            for pending, _, _ in futures[i:]:
+                                pending.cancel()
+                            break
+                            
+                    except Exception as e:
+                        logger.error(f"Failed to import {contest_id}: {str(e)}")
+                        failed.append((contest_id, str(e)))
                         self.progress.update_week_progress(game_failed=contest_id)
-                        continue
-                    
-                    # Translate to database format
-                    translated = self.translator.translate_game_for_db(
-                        game, game_stats, week_number=week
-                    )
-                    
-                    # Validate before import
-                    is_valid, errors = self.translator.validate_translated_data(translated)
-                    if not is_valid:
-                        logger.error(f"Invalid data for {contest_id}: {errors}")
-                        failed.append((contest_id, f"Validation: {errors[0]}"))
-                        continue
-                    
-                    # Import to database
-                    if self.game_importer.import_game(translated):
-                        imported += 1
-                        self.progress.update_week_progress(games_imported=1)
-                        
-                except DuplicateGameError:
-                    skipped += 1
-                    if stop_on_duplicate:
-                        logger.info("Hit duplicate game, stopping")
-                        break
-                        
-                except Exception as e:
-                    logger.error(f"Failed to import {contest_id}: {str(e)}")
-                    failed.append((contest_id, str(e)))
-                    self.progress.update_week_progress(game_failed=contest_id)
 
             # Add this right after calculating the failed count:
             if len(failed) > 3:
@@ -186,8 +230,9 @@ class SimplePipeline:
                 # Could add retry logic here in future
 
             
-            # 4. Complete week tracking
+            # 5. Complete week tracking
             elapsed = time.time() - self.start_time
+            self.api_calls += self.api_client.requests_sent - sent_before
             self.progress.complete_week(year, week, imported, failed)
             
             # Log summary
@@ -5,11 +5,40 @@ Replace the content of your src/pipeline/stats_translator.py with this
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Columns _add_derived_fields() fills in, in the order it writes them
+DERIVED_FIELDS = (
+    'rushing_avg', 'passing_avg', 'total_offense_avg', 'yards_per_play',
+    'third_down_pct', 'third_down_rate', 'pass_rush_ratio', 'turnover_diff',
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_ncaa_date(date_string: str) -> Optional[datetime]:
+    """
+    Parse an NCAA "10/19/2024" date string.
+    
+    A week's games share a handful of dates, so results are memoised and
+    strptime only runs once per distinct string.
+    
+    Args:
+        date_string: Date in format "10/19/2024"
+        
+    Returns:
+        datetime object or None if parsing fails
+    """
+    try:
+        return datetime.strptime(date_string, "%m/%d/%Y")
+    except ValueError:
+        logger.warning(f"Could not parse date: {date_string}")
+        return None
+
+
 class StatsTranslator:
     """
     Translates NCAA API response data into database-ready dictionaries.
@@ -85,6 +114,16 @@ class StatsTranslator:
             'defense_interceptions': 'interception_returns_number',
             # Note: interception_returns_yards would need to be added
         }
+        
+        # (ncaa_field, db_field) pairs, built once rather than re-walking the dict per team
+        self._field_pairs = tuple(self.stat_field_mappings.items())
+        
+        # Every key a translated team record ends up with, in final order. Each
+        # record starts as a copy, so the dict is allocated at full size once
+        # instead of growing key by key
+        self._record_template = dict.fromkeys(
+            ('team_name', 'is_home', *self.stat_field_mappings.values(), *DERIVED_FIELDS)
+        )
     
     def translate_game_for_db(self, week_game: Dict, game_stats: Dict, week_number: int = None) -> Dict:
         """
@@ -128,26 +167,28 @@ class StatsTranslator:
         # Process team stats if available
         team_stats_records = []
         if game_stats and game_stats.get('success'):
+            # Score-derived fields only depend on the perspective, so work them out once
+            has_scores = home_score is not None and away_score is not None
+            total_points = home_score + away_score if has_scores else None
+            perspectives = {
+                True: (home_score, away_score),   # home team: (scored, allowed)
+                False: (away_score, home_score),  # away team: (scored, allowed)
+            }
+            no_result = (None, None)
+            
             for team_stats in game_stats.get('team_stats', []):
                 translated_stats = self.translate_team_stats(team_stats)
                 
                 # ADD POINTS_SCORED AND POINTS_ALLOWED
-                if team_stats.get('is_home'):
-                    translated_stats['points_scored'] = home_score
-                    translated_stats['points_allowed'] = away_score
-                    translated_stats['margin'] = (home_score - away_score) if home_score is not None and away_score is not None else None
-                    translated_stats['win'] = home_score > away_score if home_score is not None and away_score is not None else None
-                else:
-                    translated_stats['points_scored'] = away_score
-                    translated_stats['points_allowed'] = home_score
-                    translated_stats['margin'] = (away_score - home_score) if home_score is not None and away_score is not None else None
-                    translated_stats['win'] = away_score > home_score if home_score is not None and away_score is not None else None
+                scored, allowed = perspectives[bool(team_stats.get('is_home'))]
+                translated_stats['points_scored'] = scored
+                translated_stats['points_allowed'] = allowed
+                margin, win = (scored - allowed, scored > allowed) if has_scores else no_result
+                translated_stats['margin'] = margin
+                translated_stats['win'] = win
                 
                 # Add total points
-                if home_score is not None and away_score is not None:
-                    translated_stats['total_points'] = home_score + away_score
-                else:
-                    translated_stats['total_points'] = None
+                translated_stats['total_points'] = total_points
                 
                 team_stats_records.append(translated_stats)
         
@@ -205,19 +246,18 @@ class StatsTranslator:
         Returns:
             Dict with database column names and converted values
         """
-        translated = {
-            'team_name': team_stats.get('team_name'),
-            'is_home': team_stats.get('is_home'),
-        }
+        get = team_stats.get
+        translated = self._record_template.copy()
+        translated['team_name'] = get('team_name')
+        translated['is_home'] = get('is_home')
         
         # Map all basic stats using our field mappings
-        for ncaa_field, db_field in self.stat_field_mappings.items():
-            value = team_stats.get(ncaa_field)
-            translated[db_field] = self._convert_to_number(value)
+        convert = self._convert_to_number
+        for ncaa_field, db_field in self._field_pairs:
+            translated[db_field] = convert(get(ncaa_field))
         
-        # Add calculated fields
-        calculated = self._calculate_derived_fields(translated)
-        translated.update(calculated)
+        # Add calculated fields straight into the same record
+        self._add_derived_fields(translated)
         
         return translated
     
@@ -234,17 +274,24 @@ class StatsTranslator:
         if value is None or value == '':
             return None
         
+        # NCAA sends most stats as plain numeric strings, so try those first
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                pass
+            
+            try:
+                # Remove any commas (e.g., "1,234" -> "1234")
+                return float(value.replace(',', ''))
+            except ValueError:
+                logger.debug("Could not convert '%s' to number", value)
+                return None
+        
         if isinstance(value, (int, float)):
             return float(value)
         
-        try:
-            # Remove any commas (e.g., "1,234" -> "1234")
-            if isinstance(value, str):
-                value = value.replace(',', '')
-                return float(value)
-        except (ValueError, AttributeError):
-            logger.debug(f"Could not convert '{value}' to number")
-            return None
+        return None
     
     def _parse_date(self, date_string: str) -> Optional[datetime]:
         """
@@ -259,73 +306,50 @@ class StatsTranslator:
         if not date_string:
             return None
         
-        try:
-            return datetime.strptime(date_string, "%m/%d/%Y")
-        except ValueError:
-            logger.warning(f"Could not parse date: {date_string}")
-            return None
+        return _parse_ncaa_date(date_string)
     
-    def _calculate_derived_fields(self, stats: Dict) -> Dict:
+    def _add_derived_fields(self, stats: Dict) -> None:
         """
         Calculate additional fields that NCAA doesn't provide directly.
         
+        They are written into `stats` itself rather than collected in a
+        second dict and merged, so each team record is built only once.
+        
         Args:
-            stats: Translated statistics dictionary
-            
-        Returns:
-            Dict with calculated fields
+            stats: Translated statistics dictionary (updated in place)
         """
-        calculated = {}
+        # Every input is read once; a missing/None stat counts as 0
+        rushing_attempts = stats.get('rushing_attempts') or 0
+        rushing_yards = stats.get('rushing_yards') or 0
+        passing_attempts = stats.get('passing_attempts') or 0
+        passing_yards = stats.get('passing_yards') or 0
+        total_plays = stats.get('total_offense_plays') or 0
+        total_yards = stats.get('total_offense_yards') or 0
+        third_conversions = stats.get('third_down_conversions') or 0
+        third_attempts = stats.get('third_down_attempts') or 0
         
         # Calculate averages
-        rushing_attempts = stats.get('rushing_attempts', 0) or 0
-        rushing_yards = stats.get('rushing_yards', 0) or 0
-        if rushing_attempts > 0:
-            calculated['rushing_avg'] = rushing_yards / rushing_attempts
-        else:
-            calculated['rushing_avg'] = None
+        stats['rushing_avg'] = rushing_yards / rushing_attempts if rushing_attempts > 0 else None
+        stats['passing_avg'] = passing_yards / passing_attempts if passing_attempts > 0 else None
         
-        passing_attempts = stats.get('passing_attempts', 0) or 0
-        passing_yards = stats.get('passing_yards', 0) or 0
-        if passing_attempts > 0:
-            calculated['passing_avg'] = passing_yards / passing_attempts
-        else:
-            calculated['passing_avg'] = None
-        
-        # Total offense average
-        total_plays = stats.get('total_offense_plays', 0) or 0
-        total_yards = stats.get('total_offense_yards', 0) or 0
-        if total_plays > 0:
-            calculated['total_offense_avg'] = total_yards / total_plays
-            calculated['yards_per_play'] = total_yards / total_plays  # Same thing
-        else:
-            calculated['total_offense_avg'] = None
-            calculated['yards_per_play'] = None
+        # Total offense average (yards_per_play is the same number)
+        yards_per_play = total_yards / total_plays if total_plays > 0 else None
+        stats['total_offense_avg'] = yards_per_play
+        stats['yards_per_play'] = yards_per_play
         
-        # Third down percentage
-        third_conversions = stats.get('third_down_conversions', 0) or 0
-        third_attempts = stats.get('third_down_attempts', 0) or 0
-        
-        if third_attempts > 0:
-            calculated['third_down_pct'] = (third_conversions / third_attempts) * 100
-            calculated['third_down_rate'] = third_conversions / third_attempts  # As decimal
-        else:
-            calculated['third_down_pct'] = None
-            calculated['third_down_rate'] = None
+        # Third down rate as a decimal, and as a percentage
+        third_down_rate = third_conversions / third_attempts if third_attempts > 0 else None
+        stats['third_down_pct'] = third_down_rate * 100 if third_down_rate is not None else None
+        stats['third_down_rate'] = third_down_rate
         
         # Pass/rush ratio
-        if total_yards and total_yards > 0:
-            calculated['pass_rush_ratio'] = (passing_yards or 0) / total_yards
-        else:
-            calculated['pass_rush_ratio'] = None
+        stats['pass_rush_ratio'] = passing_yards / total_yards if total_yards > 0 else None
         
         # Turnover differential (we'll need opponent data for this, so leave null for now)
-        calculated['turnover_diff'] = None
+        stats['turnover_diff'] = None
         
         # # Time of possession - not available from NCAA API
-        # calculated['time_of_possession'] = None
-        
-        return calculated
+        # stats['time_of_possession'] = None
     
     def validate_translated_data(self, translated_data: Dict) -> Tuple[bool, List[str]]:
         """
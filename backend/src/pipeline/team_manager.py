@@ -53,7 +53,10 @@ class TeamManager:
         This runs once at startup to populate our lookup dictionaries.
         """
         with self.db.get_session() as session:
-            teams = session.query(Team).filter(Team.is_active == True).all()
+            # Only the columns the caches use; no full ORM entities needed
+            teams = session.query(
+                Team.id, Team.slug, Team.name, Team.short_name
+            ).filter(Team.is_active == True).all()
             
             for team in teams:
                 # Cache by seoname (if available)
@@ -190,14 +193,14 @@ class TeamManager:
         # Strategy 1: Check seoname cache (fastest)
         if seoname and seoname in self.seoname_cache:
             self.cache_hits += 1
-            logger.debug(f"Cache hit for seoname: {seoname}")
+            logger.debug("Cache hit for seoname: %s", seoname)
             return self.seoname_cache[seoname], False
         
         # Strategy 2: Check name cache
         name_lower = name_short.lower()
         if name_lower in self.name_cache:
             self.cache_hits += 1
-            logger.debug(f"Cache hit for name: {name_short}")
+            logger.debug("Cache hit for name: %s", name_short)
             team_id = self.name_cache[name_lower]
             if seoname:
                 self.seoname_cache[seoname] = team_id
@@ -211,19 +214,19 @@ class TeamManager:
         if ncaa_id and ncaa_id != '':
             team = session.query(Team).filter(Team.ncaa_id == ncaa_id).first()
             if team:
-                logger.debug(f"Found by NCAA ID: {team.name}")
+                logger.debug("Found by NCAA ID: %s", team.name)
         
         # Try by slug if not found
         if not team and seoname:
             team = session.query(Team).filter(Team.slug == seoname).first()
             if team:
-                logger.debug(f"Found by slug: {team.name}")
+                logger.debug("Found by slug: %s", team.name)
         
         # Try by name if still not found
         if not team and name_short:
             team = session.query(Team).filter(Team.name == name_short).first()
             if team:
-                logger.debug(f"Found by name: {team.name}")
+                logger.debug("Found by name: %s", team.name)
         
         # If team exists, update cache and return
         if team:
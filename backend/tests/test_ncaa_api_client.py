@@ -4,9 +4,12 @@ Test script for NCAA API Client
 Run this to verify we can fetch data successfully
 """
 
+import io
+import sys
 import logging
-import json
-from pipeline.optimized_pipeline.ncaa_api_client import NCAAAPIClient
+import orjson
+from functools import lru_cache, partial
+from pipeline.ncaa_api_client import NCAAAPIClient
 
 # Set up logging to see what's happening
 logging.basicConfig(
@@ -14,16 +17,32 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+def write_json(path: str, data) -> None:
+    """Write data as indented JSON"""
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+# One client shared by every test so rate limiting spans the whole run
+client = NCAAAPIClient()
+
+@lru_cache(maxsize=None)
+def fetch_week_games(year: int, week: int) -> dict:
+    """Fetch a week's schedule once per run, keyed on (year, week)"""
+    return client.get_week_games(year, week)
+
+@lru_cache(maxsize=4096)
+def fetch_game_stats(contest_id: int) -> dict:
+    """Fetch a game's stats once per run, keyed on contest_id"""
+    return client.get_game_stats(contest_id)
+
 def test_week_fetch():
     """Test fetching a week's games"""
     print("\n" + "="*60)
     print("TEST 1: Fetching Week Schedule")
     print("="*60)
     
-    client = NCAAAPIClient()
-    
     # Test with 2024 Week 8 (from your example)
-    result = client.get_week_games(2024, 8)
+    result = fetch_week_games(2024, 8)
     
     if result['success']:
         print(f"✅ Successfully fetched Week 8 games!")
@@ -36,16 +55,21 @@ def test_week_fetch():
             home = next((t for t in game.get('teams', []) if t.get('isHome')), {})
             away = next((t for t in game.get('teams', []) if not t.get('isHome')), {})
             
+            # Look each field up once and reuse it below
+            contest_id = game.get('contestId')
+            away_name, home_name = away.get('nameShort', 'Unknown'), home.get('nameShort', 'Unknown')
+            away_score, home_score = away.get('score', 'N/A'), home.get('score', 'N/A')
+            
             print(f"Game {i+1}:")
-            print(f"  Contest ID: {game.get('contestId')}")
-            print(f"  {away.get('nameShort', 'Unknown')} @ {home.get('nameShort', 'Unknown')}")
-            print(f"  Score: {away.get('score', 'N/A')} - {home.get('score', 'N/A')}")
+            print(f"  Contest ID: {contest_id}")
+            print(f"  {away_name} @ {home_name}")
+            print(f"  Score: {away_score} - {home_score}")
             print(f"  Status: {game.get('gameState', 'Unknown')}")
             print(f"  Date: {game.get('startDate', 'Unknown')}")
             
             # Save contest ID for stats test
-            if game.get('contestId'):
-                games_to_test.append(game.get('contestId'))
+            if contest_id:
+                games_to_test.append(contest_id)
             print()
         
         return games_to_test
@@ -59,9 +83,7 @@ def test_game_stats(contest_id: int):
     print(f"TEST 2: Fetching Game Stats for Contest {contest_id}")
     print("="*60)
     
-    client = NCAAAPIClient()
-    
-    result = client.get_game_stats(contest_id)
+    result = fetch_game_stats(contest_id)
     
     if result['success']:
         print(f"✅ Successfully fetched stats for game {contest_id}!")
@@ -69,16 +91,22 @@ def test_game_stats(contest_id: int):
         print(f"  Description: {result.get('description', 'Unknown')}")
         print(f"  Status: {result.get('status', 'Unknown')} - {result.get('period', '')}")
         
+        # Buffer the per-team report and write it with a single call
+        buf = io.StringIO()
+        out = partial(print, file=buf)
+        
         # Show stats for each team
         for team_stats in result.get('team_stats', []):
-            print(f"\n{team_stats.get('team_name')} {'(Home)' if team_stats.get('is_home') else '(Away)'}:")
-            print(f"  Total Yards: {team_stats.get('total_yards', 'N/A')}")
-            print(f"  First Downs: {team_stats.get('first_downs', 'N/A')}")
-            print(f"  Passing: {team_stats.get('passing_completions', 'N/A')}/{team_stats.get('passing_attempts', 'N/A')} for {team_stats.get('passing_yards', 'N/A')} yards")
-            print(f"  Rushing: {team_stats.get('rushing_attempts', 'N/A')} att for {team_stats.get('rushing_yards', 'N/A')} yards")
-            print(f"  Third Downs: {team_stats.get('third_down_conversions', 'N/A')}/{team_stats.get('third_down_attempts', 'N/A')}")
-            print(f"  Turnovers: {team_stats.get('fumbles_lost', 'N/A')} fumbles, {team_stats.get('passing_interceptions', 'N/A')} INTs")
-            print(f"  Penalties: {team_stats.get('penalties', 'N/A')} for {team_stats.get('penalty_yards', 'N/A')} yards")
+            out(f"\n{team_stats.get('team_name')} {'(Home)' if team_stats.get('is_home') else '(Away)'}:")
+            out(f"  Total Yards: {team_stats.get('total_yards', 'N/A')}")
+            out(f"  First Downs: {team_stats.get('first_downs', 'N/A')}")
+            out(f"  Passing: {team_stats.get('passing_completions', 'N/A')}/{team_stats.get('passing_attempts', 'N/A')} for {team_stats.get('passing_yards', 'N/A')} yards")
+            out(f"  Rushing: {team_stats.get('rushing_attempts', 'N/A')} att for {team_stats.get('rushing_yards', 'N/A')} yards")
+            out(f"  Third Downs: {team_stats.get('third_down_conversions', 'N/A')}/{team_stats.get('third_down_attempts', 'N/A')}")
+            out(f"  Turnovers: {team_stats.get('fumbles_lost', 'N/A')} fumbles, {team_stats.get('passing_interceptions', 'N/A')} INTs")
+            out(f"  Penalties: {team_stats.get('penalties', 'N/A')} for {team_stats.get('penalty_yards', 'N/A')} yards")
+        
+        sys.stdout.write(buf.getvalue())
         
         return True
     else:
@@ -91,11 +119,9 @@ def test_specific_game():
     print("TEST 3: Testing with Known Game (Wis.-Whitewater vs Wis.-Stevens Point)")
     print("="*60)
     
-    client = NCAAAPIClient()
-    
     # Using the contest ID from your example
     contest_id = 6308940
-    result = client.get_game_stats(contest_id)
+    result = fetch_game_stats(contest_id)
     
     if result['success']:
         print(f"✅ Successfully fetched known game!")
@@ -130,25 +156,21 @@ def save_sample_data():
     print("SAVING SAMPLE DATA FOR REFERENCE")
     print("="*60)
     
-    client = NCAAAPIClient()
-    
-    # Get one week's data
-    week_result = client.get_week_games(2024, 8)
+    # Get one week's data (already cached by test_week_fetch)
+    week_result = fetch_week_games(2024, 8)
     
     if week_result['success'] and week_result['games']:
         # Save week data
-        with open('sample_week_data.json', 'w') as f:
-            json.dump(week_result, f, indent=2)
+        write_json('sample_week_data.json', week_result)
         print(f"✅ Saved week data to sample_week_data.json")
         
         # Get stats for first game
         first_game_id = week_result['games'][0].get('contestId')
         if first_game_id:
-            stats_result = client.get_game_stats(first_game_id)
+            stats_result = fetch_game_stats(first_game_id)
             
             if stats_result['success']:
-                with open('sample_game_stats.json', 'w') as f:
-                    json.dump(stats_result, f, indent=2)
+                write_json('sample_game_stats.json', stats_result)
                 print(f"✅ Saved game stats to sample_game_stats.json")
 
 if __name__ == "__main__":
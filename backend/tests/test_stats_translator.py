@@ -4,8 +4,11 @@ Test script for Stats Translator
 Verifies field mapping and data conversion works correctly
 """
 
+import io
+import sys
 import logging
-import json
+import orjson
+from functools import lru_cache, partial
 from pipeline.ncaa_api_client import NCAAAPIClient
 from pipeline.stats_translator import StatsTranslator
 
@@ -15,30 +18,67 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+def write_json(path: str, data) -> None:
+    """Write data as indented JSON"""
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+# One client shared by every test so rate limiting spans the whole run
+client = NCAAAPIClient()
+
+@lru_cache(maxsize=None)
+def fetch_week_games(year: int, week: int) -> dict:
+    """Fetch a week's schedule once per run, keyed on (year, week)"""
+    return client.get_week_games(year, week)
+
+@lru_cache(maxsize=4096)
+def fetch_game_stats(contest_id: int) -> dict:
+    """Fetch a game's stats once per run, keyed on contest_id"""
+    return client.get_game_stats(contest_id)
+
+# Derived fields every translated team record should carry
+CALCULATED_FIELDS = (
+    'completion_pct',
+    'third_down_pct',
+    'fourth_down_pct',
+    'total_touchdowns',
+    'turnovers'
+)
+CALCULATED_FIELDS_SET = frozenset(CALCULATED_FIELDS)
+
 def test_basic_translation():
     """Test basic translation with real API data"""
     print("\n" + "="*60)
     print("TEST 1: Basic Translation")
     print("="*60)
     
-    client = NCAAAPIClient()
     translator = StatsTranslator()
     
     # Get a week's games
-    week_result = client.get_week_games(2024, 8)
+    week_result = fetch_week_games(2024, 8)
     
     if not week_result['success']:
         print("❌ Failed to fetch week games")
         return None
     
-    # Get first game with a valid contest ID
-    game = week_result['games'][0]
+    # Get first completed game with a valid contest ID
+    game = next(
+        (g for g in week_result['games']
+         if g.get('contestId') and g.get('teams')
+         and all(t.get('score') is not None for t in g['teams'])),
+        None
+    )
+    
+    if game is None:
+        print("❌ No completed game found")
+        return None
+    
     contest_id = game.get('contestId')
     
     print(f"Testing with game {contest_id}")
     
     # Get stats for this game
-    stats_result = client.get_game_stats(contest_id)
+    stats_result = fetch_game_stats(contest_id)
     
     if not stats_result['success']:
         print("❌ Failed to fetch game stats")
@@ -75,33 +115,39 @@ def test_stats_mapping(translated_data):
     
     team_stats = translated_data['team_stats']
     
+    # Buffer the per-team report and write it with a single call
+    buf = io.StringIO()
+    out = partial(print, file=buf)
+    
     for i, stats in enumerate(team_stats):
         team_name = stats.get('team_name', 'Unknown')
         is_home = "Home" if stats.get('is_home') else "Away"
         
-        print(f"\n{team_name} ({is_home}):")
+        out(f"\n{team_name} ({is_home}):")
         
         # Check key mapped fields
-        print("  Basic Stats:")
-        print(f"    First Downs: {stats.get('first_downs')}")
-        print(f"    Total Offense: {stats.get('total_offense')} yards")
-        print(f"    Total Plays: {stats.get('total_plays')}")
+        out("  Basic Stats:")
+        out(f"    First Downs: {stats.get('first_downs')}")
+        out(f"    Total Offense: {stats.get('total_offense')} yards")
+        out(f"    Total Plays: {stats.get('total_plays')}")
         
-        print("  Passing:")
-        print(f"    Completions: {stats.get('pass_completions')}/{stats.get('pass_attempts')}")
-        print(f"    Yards: {stats.get('pass_yards')}")
-        print(f"    TDs: {stats.get('pass_tds')}")
-        print(f"    INTs: {stats.get('interceptions')}")
+        out("  Passing:")
+        out(f"    Completions: {stats.get('pass_completions')}/{stats.get('pass_attempts')}")
+        out(f"    Yards: {stats.get('pass_yards')}")
+        out(f"    TDs: {stats.get('pass_tds')}")
+        out(f"    INTs: {stats.get('interceptions')}")
         
-        print("  Rushing:")
-        print(f"    Attempts: {stats.get('rush_attempts')}")
-        print(f"    Yards: {stats.get('rush_yards')}")
-        print(f"    TDs: {stats.get('rush_tds')}")
+        out("  Rushing:")
+        out(f"    Attempts: {stats.get('rush_attempts')}")
+        out(f"    Yards: {stats.get('rush_yards')}")
+        out(f"    TDs: {stats.get('rush_tds')}")
         
-        print("  Efficiency:")
-        print(f"    3rd Downs: {stats.get('third_down_conversions')}/{stats.get('third_down_attempts')}")
-        print(f"    3rd Down %: {stats.get('third_down_pct', 0):.1f}%")
-        print(f"    Completion %: {stats.get('completion_pct', 0):.1f}%")
+        out("  Efficiency:")
+        out(f"    3rd Downs: {stats.get('third_down_conversions')}/{stats.get('third_down_attempts')}")
+        out(f"    3rd Down %: {stats.get('third_down_pct', 0):.1f}%")
+        out(f"    Completion %: {stats.get('completion_pct', 0):.1f}%")
+    
+    sys.stdout.write(buf.getvalue())
 
 def test_calculated_fields(translated_data):
     """Test that calculated fields are properly generated"""
@@ -119,20 +165,14 @@ def test_calculated_fields(translated_data):
         team_name = stats.get('team_name', 'Unknown')
         print(f"\n{team_name} Calculated Fields:")
         
-        # Check calculated fields exist
-        calculated_fields = [
-            'completion_pct',
-            'third_down_pct',
-            'fourth_down_pct',
-            'total_touchdowns',
-            'turnovers'
-        ]
+        # Check calculated fields exist (one set difference instead of a lookup per field)
+        missing = CALCULATED_FIELDS_SET - stats.keys()
         
-        for field in calculated_fields:
-            if field in stats:
-                print(f"  ✅ {field}: {stats[field]}")
-            else:
+        for field in CALCULATED_FIELDS:
+            if field in missing:
                 print(f"  ❌ {field}: MISSING")
+            else:
+                print(f"  ✅ {field}: {stats[field]}")
 
 def test_data_validation():
     """Test data validation"""
@@ -182,25 +222,20 @@ def test_specific_game():
     print("TEST 5: Known Game Translation (Wis.-Whitewater vs Wis.-Stevens Point)")
     print("="*60)
     
-    client = NCAAAPIClient()
     translator = StatsTranslator()
     
     # Get the specific week
-    week_result = client.get_week_games(2024, 8)
+    week_result = fetch_week_games(2024, 8)
     
     # Find the Whitewater game
-    target_game = None
-    for game in week_result['games']:
-        if game.get('contestId') == 6308940:
-            target_game = game
-            break
+    target_game = next((g for g in week_result['games'] if g.get('contestId') == 6308940), None)
     
     if not target_game:
         print("❌ Could not find target game")
         return
     
     # Get stats
-    stats_result = client.get_game_stats(6308940)
+    stats_result = fetch_game_stats(6308940)
     
     # Translate
     translated = translator.translate_game_for_db(target_game, stats_result, week_number=8)
@@ -225,23 +260,21 @@ def save_translated_sample():
     print("SAVING TRANSLATED SAMPLE")
     print("="*60)
     
-    client = NCAAAPIClient()
     translator = StatsTranslator()
     
     # Get one game
-    week_result = client.get_week_games(2024, 8)
+    week_result = fetch_week_games(2024, 8)
     if week_result['success'] and week_result['games']:
         game = week_result['games'][0]
-        stats_result = client.get_game_stats(game['contestId'])
+        stats_result = fetch_game_stats(game['contestId'])
         
         if stats_result['success']:
             translated = translator.translate_game_for_db(game, stats_result, week_number=8)
             
-            with open('sample_translated_data.json', 'w') as f:
-                # Convert datetime to string for JSON serialization
-                if translated['game'].get('game_date'):
-                    translated['game']['game_date'] = str(translated['game']['game_date'])
-                json.dump(translated, f, indent=2)
+            # Convert datetime to string for JSON serialization
+            if translated['game'].get('game_date'):
+                translated['game']['game_date'] = str(translated['game']['game_date'])
+            write_json('sample_translated_data.json', translated)
             print("✅ Saved translated data to sample_translated_data.json")
 
 if __name__ == "__main__":